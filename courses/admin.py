@@ -1,6 +1,8 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import Announcement, Course, Lesson, Enrollment,Notification, Progress, Quiz, Question, StudentAnswer
-from .models import Certificate
+from .models import Certificate, CertificateRenderJob
+from .admission import get_controller, release_after, user_key
+from .exports import course_certificates_zip_response
 from django.contrib import admin
 from .models import Announcement, Notification
 
@@ -10,6 +12,28 @@ from .models import Announcement, Notification
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
     list_display = ["id", "title"]
+    actions = ["download_certificates"]
+
+    @admin.action(description="Download certificates (ZIP)")
+    def download_certificates(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, "Select exactly one course.", messages.WARNING)
+            return None
+
+        # Same limits as the export API, so the admin can't bypass them
+        controller = get_controller("certificate_export")
+        admitted, status, retry_after = controller.try_enter(user_key(request))
+        if not admitted:
+            reason = "Too many certificate exports" if status == 429 else "Certificate exports are busy"
+            self.message_user(request, f"{reason}, try again in {retry_after} s.", messages.WARNING)
+            return None
+
+        try:
+            response = course_certificates_zip_response(queryset.get())
+        except BaseException:
+            controller.leave()
+            raise
+        return release_after(response, controller)
 
 
 @admin.register(Lesson)
@@ -19,7 +43,7 @@ class LessonAdmin(admin.ModelAdmin):
 
 @admin.register(Enrollment)
 class EnrollmentAdmin(admin.ModelAdmin):
-    list_display = ["id", "student", "course"]
+    list_display = ["id", "student", "course", "completed_lessons", "total_lessons"]
 
 
 @admin.register(Progress)
@@ -42,9 +66,35 @@ class StudentAnswerAdmin(admin.ModelAdmin):
     list_display = ["id", "student", "question", "selected", "is_correct"]
 @admin.register(Certificate)
 class CertificateAdmin(admin.ModelAdmin):
-    list_display = ["id", "student", "course", "issued_at"]
+    list_display = ["id", "student", "course", "issued_at", "is_revoked"]
     list_filter = ('is_revoked', 'issued_at')
     search_fields = ('student__username', 'course__title')
+    actions = ["revoke", "restore"]
+
+    # Saved one by one (not queryset.update) so the post_save signals drop
+    # the cached verification record and the stored PDF immediately.
+    def _set_revoked(self, request, queryset, revoked):
+        changed = 0
+        for certificate in queryset.filter(is_revoked=not revoked):
+            certificate.is_revoked = revoked
+            certificate.save(update_fields=["is_revoked"])
+            changed += 1
+        self.message_user(request, f"{changed} certificate(s) updated.")
+
+    @admin.action(description="Revoke selected certificates")
+    def revoke(self, request, queryset):
+        self._set_revoked(request, queryset, True)
+
+    @admin.action(description="Restore selected certificates")
+    def restore(self, request, queryset):
+        self._set_revoked(request, queryset, False)
+
+
+@admin.register(CertificateRenderJob)
+class CertificateRenderJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "certificate", "status", "created_at", "finished_at")
+    list_filter = ("status",)
+    readonly_fields = ("error",)
 
 from django.contrib import admin
 from .models import Announcement
@@ -0,0 +1,189 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from django.conf import settings
+from rest_framework.response import Response
+
+
+# -----------------------------
+# ADMISSION CONTROL
+# -----------------------------
+# Expensive endpoints (PDF downloads, ZIP exports) get a per-process
+# concurrency cap and a per-user token bucket. Requests over either limit
+# fail fast with 503 / 429 and a Retry-After header instead of piling up
+# in front of the renderer, so the worker's other threads stay free for
+# cheap endpoints. Limits come from settings.ADMISSION_LIMITS by name.
+
+DEFAULT_LIMITS = {"concurrency": 4, "rate": 1.0, "burst": 5}
+
+
+class AdmissionController:
+    """
+    Limits for one endpoint within this process.
+
+    `concurrency` requests may run at once; each user gets `burst` tokens,
+    refilled at `rate` tokens per second. Counters are exposed through
+    `metrics()`.
+    """
+
+    def __init__(self, name, concurrency, rate, burst, max_tracked_users=10000, busy_retry_after=1):
+        self.name = name
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.max_tracked_users = max_tracked_users
+        self.busy_retry_after = busy_retry_after
+
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._buckets = OrderedDict()  # user key → (tokens, updated_at), LRU
+        self._lock = threading.Lock()
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.admitted = 0
+        self.rejected_busy = 0
+        self.rejected_rate = 0
+
+    def _take_token(self, user_key):
+        """
+        Seconds until the user may retry, or None if a token was taken.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(user_key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = None
+            else:
+                retry_after = max(1, math.ceil((1 - tokens) / self.rate))
+                self.rejected_rate += 1
+
+            self._buckets[user_key] = (tokens, now)
+            while len(self._buckets) > self.max_tracked_users:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def try_enter(self, user_key):
+        """
+        (admitted, status, retry_after). Admitted callers must `leave()`.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected_busy += 1
+            return False, 503, self.busy_retry_after
+
+        # Only charged once a slot is free, so 503s don't cost tokens
+        retry_after = self._take_token(user_key)
+        if retry_after is not None:
+            self._slots.release()
+            return False, 429, retry_after
+
+        with self._lock:
+            self.admitted += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return True, None, None
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "admitted": self.admitted,
+                "rejected_busy": self.rejected_busy,
+                "rejected_rate": self.rejected_rate,
+                "tracked_users": len(self._buckets),
+            }
+
+
+_controllers = {}
+_controllers_lock = threading.Lock()
+
+
+def get_controller(name):
+    with _controllers_lock:
+        if name not in _controllers:
+            limits = {**DEFAULT_LIMITS, **getattr(settings, "ADMISSION_LIMITS", {}).get(name, {})}
+            _controllers[name] = AdmissionController(name, **limits)
+        return _controllers[name]
+
+
+def all_metrics():
+    with _controllers_lock:
+        controllers = list(_controllers.values())
+    return {controller.name: controller.metrics() for controller in controllers}
+
+
+def user_key(request):
+    if request.user.is_authenticated:
+        return f"user:{request.user.pk}"
+    return f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+class _ReleasingStream:
+    """
+    Streaming content that gives the slot back when the response is
+    closed, which the WSGI server does whether or not it was consumed.
+    """
+
+    def __init__(self, chunks, controller):
+        self.chunks = chunks
+        self.controller = controller
+        self.released = False
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self):
+        if not self.released:
+            self.released = True
+            self.controller.leave()
+
+
+def release_after(response, controller):
+    """
+    Give an admitted request's slot back once `response` is done with it.
+    """
+    if getattr(response, "streaming", False):
+        response.streaming_content = _ReleasingStream(response.streaming_content, controller)
+    else:
+        controller.leave()
+    return response
+
+
+def admission_control(name):
+    """
+    View decorator; goes below @api_view/@permission_classes so the user
+    is authenticated first. Streaming responses hold their slot until the
+    stream is finished or closed.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            controller = get_controller(name)
+            admitted, status, retry_after = controller.try_enter(user_key(request))
+            if not admitted:
+                detail = "Too many requests" if status == 429 else "Server busy, try again shortly"
+                return Response({"detail": detail}, status=status, headers={"Retry-After": str(retry_after)})
+
+            try:
+                response = view(request, *args, **kwargs)
+            except BaseException:
+                controller.leave()
+                raise
+            return release_after(response, controller)
+        return wrapper
+    return decorator
@@ -0,0 +1,94 @@
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+
+from .grading import normalize_option
+from .models import QuestionStats, StudentAnswer
+
+
+# -----------------------------
+# PER-QUESTION QUIZ ANALYTICS
+# -----------------------------
+# QuestionStats holds running counters per question: attempts and how
+# often each option was picked. submit_quiz bumps them with F()
+# increments (one upsert to create missing rows, one UPDATE for all the
+# quiz's questions), so concurrent submissions never lose a count.
+
+OPTIONS = ("a", "b", "c", "d")
+
+
+def record_submission(quiz_id, selections):
+    """
+    Count one attempt per question; `selections` maps question id to the
+    submitted option ("" when left blank).
+    """
+    if not selections:
+        return
+
+    QuestionStats.objects.bulk_create(
+        [QuestionStats(question_id=question_id, quiz_id=quiz_id) for question_id in selections],
+        ignore_conflicts=True,
+    )
+
+    increments = {"attempts": F("attempts") + 1}
+    for option in OPTIONS:
+        picked = [question_id for question_id, selected in selections.items() if selected == option]
+        if picked:
+            increments[f"selected_{option}"] = F(f"selected_{option}") + Case(
+                When(question_id__in=picked, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+    QuestionStats.objects.filter(question_id__in=list(selections)).update(**increments)
+
+
+def question_statistics(quiz_id):
+    """
+    Item statistics of a quiz's questions, from one read of QuestionStats.
+    `difficulty` is the share of attempts that picked the current correct
+    option (higher is easier); `distractors` the share of every option.
+    """
+    items = []
+    for stats in (
+        QuestionStats.objects.filter(quiz_id=quiz_id)
+        .select_related("question")
+        .order_by("question_id")
+    ):
+        question = stats.question
+        correct = normalize_option(question.correct)
+        selections = {option: getattr(stats, f"selected_{option}") for option in OPTIONS}
+        attempts = stats.attempts
+        items.append({
+            "question_id": question.id,
+            "text": question.text,
+            "correct": correct,
+            "attempts": attempts,
+            "selections": selections,
+            "blank": attempts - sum(selections.values()),
+            "difficulty": round(selections.get(correct, 0) / attempts, 4) if attempts else None,
+            "distractors": {
+                option: round(count / attempts, 4) if attempts else None
+                for option, count in selections.items()
+                if option != correct
+            },
+        })
+    return items
+
+
+def rebuild_quiz_statistics(quiz_id):
+    """
+    Recompute a quiz's counters from StudentAnswer. Only each student's
+    latest answer is stored, so rebuilt counts cover one attempt per
+    student, not every resubmission.
+    """
+    rows = (
+        StudentAnswer.objects.filter(question__quiz_id=quiz_id)
+        .values("question_id")
+        .annotate(
+            attempts=Count("id"),
+            **{f"selected_{option}": Count("id", filter=Q(selected=option)) for option in OPTIONS},
+        )
+    )
+    stats = [QuestionStats(quiz_id=quiz_id, **row) for row in rows]
+
+    QuestionStats.objects.filter(quiz_id=quiz_id).delete()
+    QuestionStats.objects.bulk_create(stats, batch_size=1000)
+    return len(stats)
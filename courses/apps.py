@@ -1,5 +1,16 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class CoursesConfig(AppConfig):
     name = 'courses'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .checks import check_certificate_signing_key
+
+        checks.register(check_certificate_signing_key)
+        from .assets import brand_assets
+
+        # Read the brand images once at startup, not on the first render
+        brand_assets.refresh(force=True)
@@ -0,0 +1,87 @@
+import base64
+import hashlib
+import mimetypes
+import os
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+
+
+BrandAsset = namedtuple("BrandAsset", ["name", "mtime_ns", "data", "sha256", "data_uri"])
+
+
+class BrandAssetRegistry:
+    """
+    Brand images kept in memory for the certificate renderers.
+
+    Each image is read once and exposed as raw bytes and as a data URI, so
+    templates embed it without any file:// lookup. The files' mtimes are
+    re-checked at most every `check_interval` seconds and changed files
+    are reloaded, so an edited logo shows up without a restart.
+    """
+
+    def __init__(self, directory, names, check_interval=5):
+        self.directory = directory
+        self.names = tuple(names)
+        self.check_interval = check_interval
+        self._assets = {}
+        self._checked_at = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _load(self, name, mtime_ns):
+        path = os.path.join(self.directory, name)
+        with open(path, "rb") as f:
+            data = f.read()
+        mime = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        return BrandAsset(
+            name=name,
+            mtime_ns=mtime_ns,
+            data=data,
+            sha256=hashlib.sha256(data).hexdigest(),
+            data_uri=f"data:{mime};base64,{base64.b64encode(data).decode()}",
+        )
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if not force and self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+
+        with self._lock:
+            changed = False
+            for name in self.names:
+                mtime_ns = os.stat(os.path.join(self.directory, name)).st_mtime_ns
+                current = self._assets.get(name)
+                if current is None or current.mtime_ns != mtime_ns:
+                    self._assets[name] = self._load(name, mtime_ns)
+                    changed = True
+
+            if changed or self._version is None:
+                digest = hashlib.sha256()
+                for name in self.names:
+                    digest.update(f"{name}:{self._assets[name].sha256}".encode())
+                self._version = digest.hexdigest()
+            self._checked_at = now
+
+    def get(self, name):
+        self.refresh()
+        return self._assets[name]
+
+    def data_uri(self, name):
+        return self.get(name).data_uri
+
+    def version(self):
+        """
+        Hash of every asset's content; changes whenever one is edited.
+        """
+        self.refresh()
+        return self._version
+
+
+brand_assets = BrandAssetRegistry(
+    os.path.join(settings.BASE_DIR, "static", "brand"),
+    ["logo.png", "people.png"],
+    check_interval=getattr(settings, "CERTIFICATE_ASSET_CHECK_SECONDS", 5),
+)
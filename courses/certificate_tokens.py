@@ -0,0 +1,132 @@
+import base64
+import hashlib
+import hmac
+import struct
+import uuid
+from collections import namedtuple
+from datetime import date
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.timezone import localtime
+
+
+# -----------------------------
+# SIGNED CERTIFICATE TOKENS
+# -----------------------------
+# A token is "<key id>.<payload>.<signature>", both parts base64url:
+#
+#   payload   = version (1 byte) | certificate uuid (16) | course id (4)
+#               | issue date as a proleptic ordinal (4) | student name (utf-8)
+#   signature = HMAC-SHA256(key, "<key id>." + payload), first 16 bytes
+#
+# The verify page can trust everything in the payload without reading the
+# certificate table. Keys live in settings.CERTIFICATE_SIGNING_KEYS by id;
+# new tokens use CERTIFICATE_SIGNING_KEY_ID, older ids keep verifying
+# until they are removed from the dict. Blank keys count as missing: with
+# no dedicated key nothing is signed and every token is rejected.
+
+TOKEN_VERSION = 1
+SIGNATURE_BYTES = 16
+_HEADER = struct.Struct(">B16sII")
+
+CertificateClaims = namedtuple(
+    "CertificateClaims", ["certificate_id", "course_id", "issued_on", "student_name"]
+)
+
+
+class InvalidToken(Exception):
+    pass
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _keys():
+    return {
+        key_id: key
+        for key_id, key in getattr(settings, "CERTIFICATE_SIGNING_KEYS", {}).items()
+        if key
+    }
+
+
+def signing_enabled():
+    return settings.CERTIFICATE_SIGNING_KEY_ID in _keys()
+
+
+def _signature(key_id, payload):
+    key = _keys()[key_id]
+    if isinstance(key, str):
+        key = key.encode()
+    message = key_id.encode() + b"." + payload.encode()
+    return hmac.new(key, message, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+
+def sign(claims, key_id=None):
+    key_id = key_id or settings.CERTIFICATE_SIGNING_KEY_ID
+    if key_id not in _keys():
+        raise ImproperlyConfigured(
+            f"No certificate signing key {key_id!r}; set the CERTIFICATE_SIGNING_KEY environment variable"
+        )
+    payload = _b64encode(
+        _HEADER.pack(
+            TOKEN_VERSION,
+            claims.certificate_id.bytes,
+            claims.course_id,
+            claims.issued_on.toordinal(),
+        )
+        + claims.student_name.encode()
+    )
+    return f"{key_id}.{payload}.{_b64encode(_signature(key_id, payload))}"
+
+
+def unsign(token):
+    """
+    Claims of a token, or InvalidToken if it is malformed, signed with an
+    unknown key or tampered with.
+    """
+    try:
+        key_id, payload, signature = token.split(".")
+    except ValueError:
+        raise InvalidToken("Malformed token")
+
+    if key_id not in _keys():
+        raise InvalidToken("Unknown key id")
+
+    try:
+        expected = _signature(key_id, payload)
+        if not hmac.compare_digest(expected, _b64decode(signature)):
+            raise InvalidToken("Bad signature")
+
+        raw = _b64decode(payload)
+        version, certificate_id, course_id, ordinal = _HEADER.unpack_from(raw)
+        if version != TOKEN_VERSION:
+            raise InvalidToken("Unsupported token version")
+
+        return CertificateClaims(
+            certificate_id=uuid.UUID(bytes=certificate_id),
+            course_id=course_id,
+            issued_on=date.fromordinal(ordinal),
+            student_name=raw[_HEADER.size:].decode(),
+        )
+    except (ValueError, struct.error):
+        raise InvalidToken("Malformed token")
+
+
+def certificate_claims(certificate):
+    student = certificate.student
+    return CertificateClaims(
+        certificate_id=certificate.id,
+        course_id=certificate.course_id,
+        issued_on=localtime(certificate.issued_at).date(),
+        student_name=student.get_full_name() or student.username,
+    )
+
+
+def certificate_token(certificate):
+    return sign(certificate_claims(certificate))
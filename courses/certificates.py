@@ -0,0 +1,193 @@
+import base64
+import hashlib
+import os
+from io import BytesIO
+
+import qrcode
+from django.conf import settings
+from django.db import transaction
+from django.template.loader import get_template
+from django.utils.timezone import localtime, now
+
+from .assets import brand_assets
+from .certificate_tokens import certificate_token, signing_enabled
+from .models import Certificate
+from .progress import enrollment_counts
+from .renderer import (
+    CERTIFICATE_STYLESHEET, CERTIFICATE_TEMPLATE, ENGINES, default_engine_name, render_pdf,
+)
+
+
+# -----------------------------
+# CERTIFICATE CONTENT
+# -----------------------------
+
+def verify_url(certificate):
+    """
+    Signed verify link encoded in the QR code; needs issued_at and student.
+    Without a signing key it falls back to the unsigned id lookup link
+    (see the courses.W001 check).
+    """
+    base_url = getattr(
+        settings,
+        "CERTIFICATE_VERIFY_BASE_URL",
+        "https://certificate-verification-backend-7gpb.onrender.com",
+    ).rstrip("/")
+    if not signing_enabled():
+        return f"{base_url}/verify-certificate/{certificate.id}/"
+    return f"{base_url}/verify/{certificate_token(certificate)}/"
+
+
+def qr_png(url):
+    # 1-bit PNG, a few hundred bytes; printed at 90px in the template
+    qr = qrcode.make(url, box_size=6)
+    buffer = BytesIO()
+    qr.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def qr_base64(url):
+    return base64.b64encode(qr_png(url)).decode()
+
+
+def build_qr(item):
+    """
+    (certificate id, url) → (certificate id, PNG); picklable for process pools.
+    """
+    certificate_id, url = item
+    return certificate_id, qr_png(url)
+
+
+def certificate_qr_base64(certificate):
+    if certificate.qr_png:
+        return base64.b64encode(certificate.qr_png).decode()
+    # Issued before QR codes were stored → see `manage.py backfill_certificate_qr`
+    return qr_base64(verify_url(certificate))
+
+
+def has_completed_course(student, course):
+    done, total = enrollment_counts(student, course)
+    return done == total
+
+
+def issue_certificate(user, course):
+    """
+    Get or create the user's certificate for a course.
+    Stamps issued_at and stores the QR code the first time.
+    """
+    # One transaction, so a failure never leaves a row without issued_at
+    with transaction.atomic():
+        certificate, created = Certificate.objects.get_or_create(student=user, course=course)
+        if not certificate.issued_at:
+            certificate.issued_at = now()
+            certificate.qr_png = qr_png(verify_url(certificate))
+            certificate.save()
+    return certificate, created
+
+
+def sample_context():
+    """
+    Context with the real brand assets, used to warm up renderers.
+    """
+    return {
+        "student_name": "Sample Student",
+        "course_name": "Sample Course",
+        "date": localtime().strftime("%d %B %Y"),
+        "logo_path": brand_assets.data_uri("logo.png"),
+        "people_icon": brand_assets.data_uri("people.png"),
+        "qr_base64": qr_base64(getattr(settings, "CERTIFICATE_VERIFY_BASE_URL", "")),
+    }
+
+
+def certificate_context(certificate):
+    """
+    Template context for a certificate.
+    Only depends on the certificate row, so the rendered PDF is stable
+    for as long as the certificate and the template stay the same.
+    """
+    user = certificate.student
+    issued_at = localtime(certificate.issued_at) if certificate.issued_at else localtime()
+
+    return {
+        "student_name": user.get_full_name() or user.username,
+        "course_name": certificate.course.title,
+        "date": issued_at.strftime("%d %B %Y"),
+        "logo_path": brand_assets.data_uri("logo.png"),
+        "people_icon": brand_assets.data_uri("people.png"),
+        "qr_base64": certificate_qr_base64(certificate),
+    }
+
+
+def certificate_engine(certificate):
+    """
+    Render engine for a certificate: the course's choice, else the deployment default.
+    """
+    return certificate.course.certificate_engine or default_engine_name()
+
+
+def render_certificate_pdf(certificate):
+    return render_pdf(certificate_context(certificate), certificate_engine(certificate))
+
+
+# -----------------------------
+# TEMPLATE VERSION
+# -----------------------------
+
+_fingerprint = {"stamp": None, "value": None}
+
+
+def _source_files():
+    return [
+        get_template(name).origin.name
+        for name in (CERTIFICATE_TEMPLATE, CERTIFICATE_STYLESHEET)
+    ]
+
+
+def template_fingerprint(engine=None):
+    """
+    Short hash of the certificate template, the brand assets and the
+    render engine's layout version.
+    Templates are re-hashed only when one of them changes on disk, the
+    brand assets come pre-hashed from the asset registry.
+    """
+    paths = _source_files()
+    stamp = tuple(
+        (path, os.stat(path).st_mtime_ns) if os.path.exists(path) else (path, None)
+        for path in paths
+    )
+
+    if _fingerprint["stamp"] != stamp:
+        digest = hashlib.sha256()
+        for path, mtime in stamp:
+            digest.update(os.path.basename(path).encode())
+            if mtime is not None:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+        _fingerprint["stamp"] = stamp
+        _fingerprint["value"] = digest.hexdigest()
+
+    engine = engine or default_engine_name()
+    key = f"{_fingerprint['value']}:{brand_assets.version()}:{engine}:{ENGINES[engine].version}"
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def certificate_fingerprint(certificate):
+    return template_fingerprint(certificate_engine(certificate))
+
+
+# -----------------------------
+# HTTP VALIDATORS
+# -----------------------------
+
+def certificate_etag(certificate):
+    """
+    Strong ETag for a certificate PDF.
+    Changes with the issue date, the template version and revocation.
+    """
+    key = ":".join([
+        str(certificate.id),
+        certificate.issued_at.isoformat() if certificate.issued_at else "",
+        "revoked" if certificate.is_revoked else "valid",
+        certificate_fingerprint(certificate),
+    ])
+    return '"%s"' % hashlib.sha256(key.encode()).hexdigest()[:32]
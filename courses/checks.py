@@ -0,0 +1,19 @@
+from django.core import checks
+
+from .certificate_tokens import signing_enabled
+
+
+def check_certificate_signing_key(app_configs, **kwargs):
+    if signing_enabled():
+        return []
+    return [
+        checks.Warning(
+            "No certificate signing key is configured.",
+            hint=(
+                "Set the CERTIFICATE_SIGNING_KEY environment variable. Until then, new "
+                "certificates get unsigned /verify-certificate/<id>/ QR links and signed "
+                "/verify/<token>/ links are rejected."
+            ),
+            id="courses.W001",
+        )
+    ]
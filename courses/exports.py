@@ -0,0 +1,67 @@
+import zipfile
+
+from django.http import StreamingHttpResponse
+from django.utils.text import slugify
+from django.utils.timezone import localtime
+
+from .models import Certificate
+from .pdf_store import get_certificate_pdf
+
+
+class _ZipStream:
+    """
+    Write-only file object for ZipFile.
+    Holds only what was written since the last `pop()`; having no
+    seek/tell makes ZipFile use data descriptors instead of rewinding.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def iter_course_certificates_zip(course, chunk_size=500):
+    """
+    Yield a ZIP archive of a course's valid certificates, one PDF at a time.
+    """
+    stream = _ZipStream()
+    certificates = (
+        Certificate.objects
+        .filter(course=course, is_revoked=False, issued_at__isnull=False)
+        .select_related("student", "course")
+        .order_by("issued_at", "id")
+        .iterator(chunk_size=chunk_size)
+    )
+
+    # PDFs are already compressed, deflating them again only costs CPU
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as archive:
+        for certificate in certificates:
+            entry = zipfile.ZipInfo(
+                f"{certificate.student.username}_{certificate.id}.pdf",
+                date_time=localtime(certificate.issued_at).timetuple()[:6],
+            )
+            archive.writestr(entry, get_certificate_pdf(certificate))
+            yield stream.pop()
+
+    # Central directory, written on close
+    yield stream.pop()
+
+
+def course_certificates_zip_response(course):
+    response = StreamingHttpResponse(
+        iter_course_certificates_zip(course), content_type="application/zip"
+    )
+    filename = f"{slugify(course.title) or course.id}_certificates.zip"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
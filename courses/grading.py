@@ -0,0 +1,73 @@
+import threading
+
+from .models import Question
+
+
+# -----------------------------
+# ANSWER KEYS
+# -----------------------------
+# {question id: normalized option} per quiz, cached in this process and
+# stamped with Quiz.content_version. Question saves and deletes bump the
+# version (see signals), so a stale key is simply never looked up again.
+
+_keys = {}  # quiz id → (content version, key)
+_lock = threading.Lock()
+
+_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+
+# Minimum score (percent, rounded down) that passes a quiz
+PASS_SCORE = 60
+
+
+def normalize_option(value):
+    # " B) " → "b"; only a–z survive
+    return "".join(c for c in str(value).lower() if c in _LETTERS)
+
+
+def answer_key(quiz):
+    """
+    Answer key of a quiz instance; reads the questions only when the
+    quiz's content_version isn't cached yet.
+    """
+    cached = _keys.get(quiz.id)
+    if cached is not None and cached[0] == quiz.content_version:
+        return cached[1]
+
+    key = {
+        question_id: normalize_option(correct)
+        for question_id, correct in (
+            Question.objects.filter(quiz_id=quiz.id).order_by("id").values_list("id", "correct")
+        )
+    }
+    with _lock:
+        _keys[quiz.id] = (quiz.content_version, key)
+    return key
+
+
+def grade(key, answers):
+    """
+    (correct count, per-question details) for submitted `answers`
+    ({question id as str: option}), against an answer key.
+    """
+    correct = 0
+    details = []
+    for question_id, correct_option in key.items():
+        selected = str(answers.get(str(question_id), "")).strip().lower()
+        is_correct = selected == correct_option
+        correct += is_correct
+        details.append({
+            "question_id": question_id,
+            "selected": selected,
+            "correct": correct_option,
+            "is_correct": is_correct,
+        })
+    return correct, details
+
+
+def quiz_score(correct, total):
+    return int(correct / total * 100) if total else 0
+
+
+def forget(quiz_id):
+    with _lock:
+        _keys.pop(quiz_id, None)
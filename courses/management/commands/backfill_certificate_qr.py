@@ -0,0 +1,54 @@
+import time
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from courses.certificates import build_qr, verify_url
+from courses.models import Certificate
+
+
+class Command(BaseCommand):
+    help = "Generate and store QR codes for certificates issued without one."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--force", action="store_true",
+                            help="Regenerate every QR code, e.g. after the verify URL changed.")
+
+    def handle(self, *args, **options):
+        certificates = Certificate.objects.filter(issued_at__isnull=False)
+        if not options["force"]:
+            certificates = certificates.filter(qr_png__isnull=True)
+
+        certificates = list(certificates.select_related("student").defer("qr_png"))
+        if not certificates:
+            self.stdout.write("Nothing to backfill.")
+            return
+
+        batch_size = options["batch_size"]
+        items = [(certificate.id, verify_url(certificate)) for certificate in certificates]
+
+        connections.close_all()
+        start = time.perf_counter()
+        done = 0
+        batch = []
+
+        with Pool(max(1, options["workers"])) as pool:
+            for certificate_id, png in pool.imap_unordered(build_qr, items, chunksize=64):
+                batch.append(Certificate(id=certificate_id, qr_png=png))
+                if len(batch) >= batch_size:
+                    Certificate.objects.bulk_update(batch, ["qr_png"])
+                    done += len(batch)
+                    batch = []
+                    self.stdout.write(f"{done}/{len(items)} QR codes stored")
+
+        if batch:
+            Certificate.objects.bulk_update(batch, ["qr_png"])
+            done += len(batch)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {done} QR code(s) in {elapsed:.1f}s ({done / elapsed:.0f}/s)."
+        ))
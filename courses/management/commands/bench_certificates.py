@@ -0,0 +1,194 @@
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.template.loader import render_to_string
+from django.utils.timezone import now
+
+from core.models import Student, Teacher
+from courses.certificates import (
+    certificate_context, certificate_engine, has_completed_course, qr_png, verify_url,
+)
+from courses.models import Certificate, Course, Enrollment, Lesson, Progress
+from courses.progress import rebuild_course_progress
+from courses.renderer import CERTIFICATE_TEMPLATE, ENGINES, get_engine
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+def summarize(latencies, rss_before):
+    # ru_maxrss is the process high-water mark, so a stage can only be
+    # charged for how far it raised it
+    return {
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "peak_rss_growth_mb": round(peak_rss_mb() - rss_before, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the certificate pipeline (eligibility, QR, template, PDF) "
+        "against synthetic data in a temporary SQLite database. Prints JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=50)
+        parser.add_argument("--courses", type=int, default=2)
+        parser.add_argument("--lessons", type=int, default=10)
+        parser.add_argument("--engine", choices=sorted(ENGINES),
+                            help="Render engine, defaults to settings.CERTIFICATE_RENDER_ENGINE.")
+        parser.add_argument("--output", help="Write the JSON report to this file as well.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("bench_certificates needs the SQLite database backend.")
+
+        # Never touch the real database: build a throwaway one in a temp dir
+        tmp_dir = tempfile.mkdtemp(prefix="bench_certificates_")
+        connection.settings_dict.setdefault("TEST", {})
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(tmp_dir, "bench.sqlite3")
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+
+        try:
+            report = self.run_benchmark(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+        self.stdout.write(output)
+
+    def create_data(self, students, courses, lessons):
+        teacher_user = User.objects.create(username="bench_teacher")
+        teacher = Teacher.objects.create(user=teacher_user, subject="Benchmarks")
+
+        User.objects.bulk_create([
+            User(username=f"bench_{i}", first_name="Student", last_name=str(i))
+            for i in range(students)
+        ])
+        users = list(User.objects.filter(username__startswith="bench_").exclude(id=teacher_user.id))
+        Student.objects.bulk_create([
+            Student(user=user, roll_number=f"B{user.id}", department="Bench")
+            for user in users
+        ])
+
+        Course.objects.bulk_create([
+            Course(title=f"Course {i}", description="Synthetic", teacher=teacher)
+            for i in range(courses)
+        ])
+        course_list = list(Course.objects.all())
+        Lesson.objects.bulk_create([
+            Lesson(course=course, title=f"Lesson {n}", content="...", order=n)
+            for course in course_list
+            for n in range(1, lessons + 1)
+        ])
+
+        Progress.objects.bulk_create([
+            Progress(student=student, lesson=lesson, completed=True)
+            for student in Student.objects.all()
+            for lesson in Lesson.objects.all()
+        ], batch_size=1000)
+
+        # Real students are enrolled, so eligibility reads their counters
+        Enrollment.objects.bulk_create([
+            Enrollment(student=student, course=course)
+            for student in Student.objects.all()
+            for course in course_list
+        ], batch_size=1000)
+        for course in course_list:
+            rebuild_course_progress(course.id)
+
+        Certificate.objects.bulk_create([
+            Certificate(student=student.user, course=course, issued_at=now())
+            for student in Student.objects.select_related("user")
+            for course in course_list
+        ], batch_size=1000)
+
+    def run_benchmark(self, options):
+        self.create_data(options["students"], options["courses"], options["lessons"])
+
+        certificates = list(
+            Certificate.objects.select_related("student__student", "course")
+        )
+        engine_name = options["engine"] or certificate_engine(certificates[0])
+        engine = get_engine(engine_name)
+        stages = {}
+
+        def run_stage(name, func):
+            latencies, results = [], []
+            rss_before = peak_rss_mb()
+            for certificate in certificates:
+                start = time.perf_counter()
+                results.append(func(certificate))
+                latencies.append((time.perf_counter() - start) * 1000)
+            stages[name] = summarize(latencies, rss_before)
+            return results
+
+        run_stage("eligibility", lambda c: has_completed_course(c.student.student, c.course))
+        run_stage("qr", lambda c: qr_png(verify_url(c)))
+
+        contexts = {c.id: certificate_context(c) for c in certificates}
+        engine.warm_up(contexts[certificates[0].id])
+
+        if engine_name == "weasyprint":
+            html = dict(zip(
+                (c.id for c in certificates),
+                run_stage("template", lambda c: render_to_string(CERTIFICATE_TEMPLATE, contexts[c.id])),
+            ))
+            pdfs = run_stage("pdf", lambda c: engine.render_html(html[c.id]))
+        else:
+            pdfs = run_stage("pdf", lambda c: engine.render(contexts[c.id]))
+
+        sizes = sorted(len(pdf) for pdf in pdfs)
+        stages["pdf"]["size_bytes"] = {
+            "p50": percentile(sizes, 50),
+            "p95": percentile(sizes, 95),
+            "max": sizes[-1],
+        }
+
+        return {
+            "commit": git_commit(),
+            "engine": engine_name,
+            "python": platform.python_version(),
+            "certificates": len(certificates),
+            "students": options["students"],
+            "courses": options["courses"],
+            "lessons_per_course": options["lessons"],
+            "stages": stages,
+            "peak_rss_mb": peak_rss_mb(),
+        }
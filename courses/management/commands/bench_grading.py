@@ -0,0 +1,70 @@
+import json
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.grading import grade, normalize_option
+
+
+def legacy_grade(questions, answers):
+    # What submit_quiz used to do per question, minus the DB writes
+    correct = 0
+    details = []
+    for question_id, raw_correct in questions:
+        selected = str(answers.get(str(question_id), "")).strip().lower()
+        correct_option = re.sub(r'[^a-z]', '', raw_correct.strip().lower())
+        is_correct = selected == correct_option
+        correct += is_correct
+        details.append({
+            "question_id": question_id,
+            "selected": selected,
+            "correct": correct_option,
+            "is_correct": is_correct,
+        })
+    return correct, details
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure in-memory grading throughput (submissions/s): regex-per-question "
+        "grading versus a cached answer key. No database access. Prints JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--questions", type=int, default=50)
+        parser.add_argument("--submissions", type=int, default=20000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def measure(self, func, submissions):
+        start = time.perf_counter()
+        for answers in submissions:
+            func(answers)
+        elapsed = time.perf_counter() - start
+        return {
+            "submissions_per_second": round(len(submissions) / elapsed),
+            "us_per_submission": round(elapsed / len(submissions) * 1e6, 2),
+        }
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        questions = [(i, rng.choice("ABCD")) for i in range(1, options["questions"] + 1)]
+        key = {question_id: normalize_option(correct) for question_id, correct in questions}
+        submissions = [
+            {str(question_id): rng.choice("abcd") for question_id, _ in questions}
+            for _ in range(options["submissions"])
+        ]
+
+        # Both must agree before their speed means anything
+        for answers in submissions[:100]:
+            if legacy_grade(questions, answers) != grade(key, answers):
+                raise CommandError("Answer-key grading disagrees with the legacy grading")
+
+        report = {
+            "questions": options["questions"],
+            "submissions": options["submissions"],
+            "legacy_regex": self.measure(lambda a: legacy_grade(questions, a), submissions),
+            "answer_key": self.measure(lambda a: grade(key, a), submissions),
+        }
+        self.stdout.write(json.dumps(report, indent=2))
@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+
+from courses.certificates import sample_context
+from courses.renderer import (
+    CERTIFICATE_STYLESHEET, CERTIFICATE_TEMPLATE, ENGINES, RendererPool, default_engine_name,
+)
+
+
+def cold_render(context):
+    # What every download used to do: parse CSS, set up fonts, decode images
+    from weasyprint import CSS, HTML
+
+    html_string = render_to_string(CERTIFICATE_TEMPLATE, context)
+    stylesheet = CSS(string=render_to_string(CERTIFICATE_STYLESHEET))
+    return HTML(string=html_string).write_pdf(stylesheets=[stylesheet])
+
+
+def timed(render, contexts):
+    latencies = []
+    for context in contexts:
+        start = time.perf_counter()
+        render(context)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+class Command(BaseCommand):
+    help = "Compare per-certificate latency of cold renders against the warm render engines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                            help="Engine(s) to measure, all by default.")
+        parser.add_argument("--processes", type=int, default=0,
+                            help="Also measure pool throughput with this many workers.")
+
+    def report(self, label, latencies):
+        latencies = sorted(latencies)
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        self.stdout.write(
+            f"{label:<18} mean {statistics.mean(latencies):8.1f} ms   "
+            f"p50 {statistics.median(latencies):8.1f} ms   p95 {p95:8.1f} ms"
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        contexts = []
+        for i in range(iterations):
+            context = sample_context()
+            context["student_name"] = f"Student {i}"
+            contexts.append(context)
+
+        engines = options["engine"] or sorted(ENGINES)
+
+        if "weasyprint" in engines:
+            self.report("weasyprint cold", timed(cold_render, contexts))
+
+        for name in engines:
+            engine = ENGINES[name]().warm_up(sample_context())
+            self.report(f"{name} warm", timed(engine.render, contexts))
+
+        if options["processes"]:
+            name = default_engine_name()
+            with RendererPool(options["processes"], warm_up_context=sample_context(), engines=[name]) as pool:
+                # Make sure every worker has started and warmed up before timing
+                list(pool.map([(name, sample_context())] * options["processes"]))
+                start = time.perf_counter()
+                list(pool.map([(name, context) for context in contexts]))
+                elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"{name} pool, {options['processes']} workers: "
+                f"{iterations / elapsed:8.1f} certificates/s"
+            )
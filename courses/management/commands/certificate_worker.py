@@ -0,0 +1,92 @@
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from courses.certificates import sample_context
+from courses.render_queue import claim_next_job, requeue_stale_jobs, run_job, stale_after
+from courses.renderer import get_engine
+
+
+def work(poll_interval, once, stale_seconds):
+    # Parse the stylesheet, load fonts and decode brand images before the first job
+    get_engine().warm_up(sample_context())
+    rendered = 0
+    # Jobs of a crashed sibling (or an earlier run) come back while we keep running
+    requeue_every = max(poll_interval, min(60, stale_seconds))
+    requeued_at = time.monotonic()
+
+    while True:
+        if time.monotonic() - requeued_at >= requeue_every:
+            requeue_stale_jobs(stale_seconds)
+            requeued_at = time.monotonic()
+
+        job = claim_next_job()
+        if job is None:
+            if once:
+                return rendered
+            time.sleep(poll_interval)
+            continue
+
+        run_job(job)
+        rendered += 1
+
+
+class Command(BaseCommand):
+    help = "Render queued certificate PDFs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1)
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument(
+            "--stale-after", type=int, default=None,
+            help="Requeue jobs stuck in 'rendering' for this many seconds "
+                 "(default: settings.CERTIFICATE_RENDER_STALE_SECONDS).",
+        )
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Exit once the queue is empty instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        stale_seconds = options["stale_after"] or stale_after()
+        requeued = requeue_stale_jobs(stale_seconds)
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s).")
+
+        processes = max(1, options["processes"])
+        self.stdout.write(f"Starting {processes} certificate worker(s)...")
+        args = (options["poll_interval"], options["once"], stale_seconds)
+
+        if processes == 1:
+            rendered = work(*args)
+            self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} certificate(s)."))
+            return
+
+        # Each process must open its own DB connection, never share the parent's
+        connections.close_all()
+        workers = [self.start_worker(args) for _ in range(processes)]
+        try:
+            while workers:
+                time.sleep(options["poll_interval"])
+                running = []
+                for p in workers:
+                    if p.is_alive():
+                        running.append(p)
+                    elif p.exitcode != 0:
+                        # Killed mid-render (OOM, renderer crash): its job is
+                        # requeued once stale, the slot is refilled now
+                        self.stderr.write(f"Worker {p.pid} died (exit code {p.exitcode}), restarting.")
+                        running.append(self.start_worker(args))
+                workers = running
+        except KeyboardInterrupt:
+            for p in workers:
+                p.terminate()
+
+        self.stdout.write(self.style.SUCCESS("Certificate workers stopped."))
+
+    def start_worker(self, args):
+        p = multiprocessing.Process(target=work, args=args)
+        p.start()
+        return p
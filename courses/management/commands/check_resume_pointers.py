@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from courses.models import Enrollment
+from courses.progress import PROGRESS_FIELDS, expected_progress
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare every enrollment's progress counters and resume pointers with "
+        "its Progress rows. Exits non-zero on drift unless --fix is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course", type=int, action="append",
+                            help="Only this course (repeatable). Defaults to every course.")
+        parser.add_argument("--fix", action="store_true", help="Rewrite the enrollments that drifted.")
+
+    def handle(self, *args, **options):
+        enrollments = Enrollment.objects.only("id", "student_id", "course_id", *PROGRESS_FIELDS)
+        if options["course"]:
+            enrollments = enrollments.filter(course_id__in=options["course"])
+
+        by_course = {}
+        for enrollment in enrollments.order_by("course_id", "id"):
+            by_course.setdefault(enrollment.course_id, []).append(enrollment)
+
+        checked = 0
+        drifted = []
+        for course_id, course_enrollments in by_course.items():
+            expected = expected_progress(course_id, course_enrollments)
+            for enrollment in course_enrollments:
+                checked += 1
+                stored = tuple(getattr(enrollment, field) for field in PROGRESS_FIELDS)
+                if stored != expected[enrollment.id]:
+                    self.stdout.write(
+                        f"Enrollment {enrollment.id} (course {course_id}, student {enrollment.student_id}): "
+                        f"stored {stored}, expected {expected[enrollment.id]}"
+                    )
+                    for field, value in zip(PROGRESS_FIELDS, expected[enrollment.id]):
+                        setattr(enrollment, field, value)
+                    drifted.append(enrollment)
+
+        if drifted and options["fix"]:
+            with transaction.atomic():
+                Enrollment.objects.bulk_update(
+                    drifted,
+                    ["completed_lessons", "total_lessons", "last_completed_lesson", "next_lesson"],
+                    batch_size=500,
+                )
+            self.stdout.write(self.style.SUCCESS(f"Fixed {len(drifted)} of {checked} enrollment(s)."))
+        elif drifted:
+            raise CommandError(f"{len(drifted)} of {checked} enrollment(s) drifted; rerun with --fix.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"All {checked} enrollment(s) consistent."))
@@ -0,0 +1,120 @@
+import time
+from multiprocessing import Pool
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Count, Exists, OuterRef
+from django.utils.timezone import now
+
+from courses.certificates import (
+    build_qr, certificate_context, certificate_engine, sample_context, verify_url,
+)
+from courses.models import Certificate, Course, Notification, Progress
+from courses.pdf_store import pdf_store
+from courses.renderer import RendererPool
+
+
+class Command(BaseCommand):
+    help = "Issue certificates to every student who has completed a course."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course", type=int, required=True)
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--no-render", action="store_true",
+                            help="Only create the certificates, leave rendering to downloads.")
+
+    def handle(self, *args, **options):
+        try:
+            course = Course.objects.get(id=options["course"])
+        except Course.DoesNotExist:
+            raise CommandError(f"Course {options['course']} does not exist")
+
+        workers = max(1, options["workers"])
+        batch_size = options["batch_size"]
+
+        total = course.lessons.count()
+        if not total:
+            raise CommandError("Course has no lessons, nobody can complete it")
+
+        # Same rule as the certificate view: every lesson completed
+        eligible_user_ids = list(
+            Progress.objects.filter(lesson__course=course, completed=True)
+            .annotate(has_certificate=Exists(
+                Certificate.objects.filter(student=OuterRef("student__user"), course=course)
+            ))
+            .filter(has_certificate=False)
+            .values("student__user")
+            .annotate(done=Count("lesson", distinct=True))
+            .filter(done=total)
+            .values_list("student__user", flat=True)
+        )
+        self.stdout.write(f"{len(eligible_user_ids)} student(s) eligible for '{course.title}'")
+        if not eligible_user_ids:
+            return
+
+        start = time.perf_counter()
+        issued_at = now()
+        # The signed QR link carries the student's name
+        users = User.objects.in_bulk(eligible_user_ids)
+        certificates = {
+            certificate.id: certificate
+            for certificate in (
+                Certificate(student=users[user_id], course=course, issued_at=issued_at)
+                for user_id in eligible_user_ids
+            )
+        }
+
+        connections.close_all()
+        with Pool(workers) as pool:
+            items = [(certificate.id, verify_url(certificate)) for certificate in certificates.values()]
+            for certificate_id, png in pool.imap_unordered(build_qr, items, chunksize=64):
+                certificates[certificate_id].qr_png = png
+
+        with transaction.atomic():
+            # A student may have downloaded theirs meanwhile → skip, don't fail
+            Certificate.objects.bulk_create(
+                certificates.values(), batch_size=batch_size, ignore_conflicts=True
+            )
+            ids = list(certificates)
+            created = []
+            for i in range(0, len(ids), batch_size):
+                created.extend(
+                    Certificate.objects.filter(id__in=ids[i:i + batch_size])
+                    .select_related("student", "course")
+                )
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        user_id=certificate.student_id,
+                        message="Your certificate has been generated ✅",
+                    )
+                    for certificate in created
+                ],
+                batch_size=batch_size,
+            )
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"Issued {len(created)} certificate(s) in {elapsed:.1f}s")
+
+        if options["no_render"] or not created:
+            return
+
+        self.stdout.write(f"Rendering with {workers} worker(s)...")
+        start = time.perf_counter()
+        engine = certificate_engine(created[0])
+        items = [(engine, certificate_context(certificate)) for certificate in created]
+
+        with RendererPool(workers, warm_up_context=sample_context(), engines=[engine]) as pool:
+            for i, (certificate, pdf) in enumerate(zip(created, pool.map(items, chunksize=4)), 1):
+                pdf_store.put(certificate, pdf)
+                if i % 100 == 0 or i == len(created):
+                    rate = i / (time.perf_counter() - start)
+                    self.stdout.write(f"{i}/{len(created)} rendered ({rate:.1f}/s)")
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {len(created)} certificate(s) in {elapsed:.1f}s "
+            f"({len(created) / elapsed:.1f}/s)"
+        ))
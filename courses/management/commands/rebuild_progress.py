@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from courses.models import Course, Enrollment
+from courses.progress import rebuild_course_progress
+
+
+class Command(BaseCommand):
+    help = "Recompute the progress counters and resume pointers of enrollments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course", type=int, action="append",
+                            help="Only this course (repeatable). Defaults to every course.")
+
+    def handle(self, *args, **options):
+        course_ids = options["course"]
+        if course_ids:
+            missing = set(course_ids) - set(Course.objects.filter(id__in=course_ids).values_list("id", flat=True))
+            if missing:
+                raise CommandError(f"Unknown course(s): {', '.join(map(str, sorted(missing)))}")
+        else:
+            course_ids = list(
+                Enrollment.objects.order_by().values_list("course_id", flat=True).distinct()
+            )
+
+        start = time.perf_counter()
+        total = 0
+        for course_id in course_ids:
+            with transaction.atomic():
+                count = rebuild_course_progress(course_id)
+            total += count
+            self.stdout.write(f"Course {course_id}: {count} enrollment(s)")
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {total} enrollment(s) in {elapsed:.1f}s"
+        ))
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from courses.analytics import rebuild_quiz_statistics
+from courses.models import Quiz
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute per-question quiz statistics from stored answers. Only each "
+        "student's latest answer is stored, so resubmissions are counted once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--quiz", type=int, action="append",
+                            help="Only this quiz (repeatable). Defaults to every quiz.")
+
+    def handle(self, *args, **options):
+        quiz_ids = options["quiz"] or list(Quiz.objects.values_list("id", flat=True))
+        missing = set(quiz_ids) - set(Quiz.objects.filter(id__in=quiz_ids).values_list("id", flat=True))
+        if missing:
+            raise CommandError(f"Unknown quiz(zes): {', '.join(map(str, sorted(missing)))}")
+
+        start = time.perf_counter()
+        total = 0
+        for quiz_id in quiz_ids:
+            with transaction.atomic():
+                count = rebuild_quiz_statistics(quiz_id)
+            total += count
+            self.stdout.write(f"Quiz {quiz_id}: {count} question(s)")
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt statistics for {total} question(s) in {elapsed:.1f}s"
+        ))
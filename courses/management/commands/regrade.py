@@ -0,0 +1,136 @@
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import Student
+from courses.grading import PASS_SCORE, answer_key, quiz_score
+from courses.models import Lesson, Progress, Quiz, StudentAnswer
+from courses.progress import complete_lesson, rebuild_course_progress
+
+
+def chunked(ids, size=500):
+    ids = sorted(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+class Command(BaseCommand):
+    help = (
+        "Regrade every stored answer of a quiz against its current answer key, "
+        "then update pass status, completed_quizzes and lesson progress."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--quiz", type=int, required=True)
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them.")
+        parser.add_argument("--revoke-progress", action="store_true",
+                            help="Also un-complete the quiz's lesson for students who no longer pass.")
+
+    def handle(self, *args, **options):
+        try:
+            quiz = Quiz.objects.get(id=options["quiz"])
+        except Quiz.DoesNotExist:
+            raise CommandError(f"Quiz {options['quiz']} does not exist")
+
+        key = answer_key(quiz)
+        if not key:
+            raise CommandError("Quiz has no questions")
+
+        chunk_size = options["chunk_size"]
+        dry_run = options["dry_run"]
+
+        # Only per-student totals are kept in memory, never all answer rows
+        correct_by_student = Counter()
+        rows = changed = pages = 0
+        start = time.perf_counter()
+
+        # Paged by id, each page fully read before it is written back: no
+        # cursor stays open across the updates (SQLite gives no isolation
+        # between queries on one connection)
+        answers = (
+            StudentAnswer.objects.filter(question__quiz_id=quiz.id)
+            .only("id", "student_id", "question_id", "selected", "is_correct")
+            .order_by("id")
+        )
+        last_id = 0
+        while True:
+            page = list(answers.filter(id__gt=last_id)[:chunk_size])
+            if not page:
+                break
+            last_id = page[-1].id
+
+            pending = []
+            for answer in page:
+                is_correct = answer.selected == key.get(answer.question_id)
+                correct_by_student[answer.student_id] += is_correct
+                if is_correct != answer.is_correct:
+                    answer.is_correct = is_correct
+                    pending.append(answer)
+            changed += self.flush(pending, dry_run)
+
+            rows += len(page)
+            pages += 1
+            if pages % 20 == 0:
+                self.progress(rows, changed, start)
+
+        self.progress(rows, changed, start)
+
+        total = len(key)
+        passing = {
+            student_id
+            for student_id, correct in correct_by_student.items()
+            if quiz_score(correct, total) >= PASS_SCORE
+        }
+        self.update_results(quiz, set(correct_by_student), passing, dry_run, options["revoke_progress"])
+
+    def flush(self, pending, dry_run):
+        count = len(pending)
+        if count and not dry_run:
+            StudentAnswer.objects.bulk_update(pending, ["is_correct"], batch_size=1000)
+        pending.clear()
+        return count
+
+    def progress(self, rows, changed, start):
+        elapsed = time.perf_counter() - start
+        rate = rows / elapsed if elapsed else 0
+        self.stdout.write(f"{rows} answer(s) regraded, {changed} changed ({rate:,.0f} rows/s)")
+
+    def update_results(self, quiz, graded, passing, dry_run, revoke_progress):
+        through = Student.completed_quizzes.through
+        completed = graded & set(
+            through.objects.filter(quiz_id=quiz.id).values_list("student_id", flat=True)
+        )
+        newly_passed = passing - completed
+        newly_failed = (graded - passing) & completed
+
+        self.stdout.write(
+            f"{len(passing)} of {len(graded)} student(s) pass: "
+            f"{len(newly_passed)} newly passed, {len(newly_failed)} no longer pass"
+        )
+        if dry_run or not (newly_passed or newly_failed):
+            return
+
+        lesson = Lesson.objects.filter(quiz=quiz).first()
+        with transaction.atomic():
+            through.objects.bulk_create(
+                [through(student_id=student_id, quiz_id=quiz.id) for student_id in newly_passed],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+            for ids in chunked(newly_failed):
+                through.objects.filter(quiz_id=quiz.id, student_id__in=ids).delete()
+
+            if lesson is None:
+                return
+
+            for ids in chunked(newly_passed):
+                for student in Student.objects.filter(id__in=ids):
+                    complete_lesson(student, lesson)
+
+            if revoke_progress and newly_failed:
+                for ids in chunked(newly_failed):
+                    Progress.objects.filter(lesson=lesson, student_id__in=ids).update(completed=False)
+                rebuild_course_progress(lesson.course_id, newly_failed)
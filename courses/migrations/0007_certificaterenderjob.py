@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-17 07:39
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_notification_created_by_notification_title_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CertificateRenderJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('rendering', 'Rendering'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('certificate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='render_jobs', to='courses.certificate')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='courses_cer_status_d01a7a_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 07:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_certificaterenderjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='certificate',
+            name='qr_png',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 07:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_certificate_qr_png'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='certificate_engine',
+            field=models.CharField(blank=True, choices=[('weasyprint', 'WeasyPrint'), ('reportlab', 'ReportLab')], default='', max_length=20),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-17 07:54
+
+from django.db import migrations, models
+
+
+def seed_revocations(apps, schema_editor):
+    Certificate = apps.get_model("courses", "Certificate")
+    RevocationEvent = apps.get_model("courses", "RevocationEvent")
+    RevocationEvent.objects.bulk_create(
+        [
+            RevocationEvent(certificate_id=certificate_id, revoked=True)
+            for certificate_id in Certificate.objects.filter(is_revoked=True).values_list("id", flat=True)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0009_course_certificate_engine'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevocationEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('certificate_id', models.UUIDField()),
+                ('revoked', models.BooleanField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RunPython(seed_revocations, migrations.RunPython.noop),
+    ]
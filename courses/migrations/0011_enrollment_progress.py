@@ -0,0 +1,74 @@
+# Generated by Django 6.0.1 on 2026-10-17 08:00
+
+import django.db.models.deletion
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def fill_progress(apps, schema_editor):
+    Enrollment = apps.get_model("courses", "Enrollment")
+    Lesson = apps.get_model("courses", "Lesson")
+    Progress = apps.get_model("courses", "Progress")
+
+    lessons = defaultdict(list)
+    for course_id, lesson_id in Lesson.objects.order_by("order", "id").values_list("course_id", "id"):
+        lessons[course_id].append(lesson_id)
+
+    completed = defaultdict(set)
+    for student_id, course_id, lesson_id in Progress.objects.filter(completed=True).values_list(
+        "student_id", "lesson__course_id", "lesson_id"
+    ):
+        completed[student_id, course_id].add(lesson_id)
+
+    enrollments = list(Enrollment.objects.all())
+    for enrollment in enrollments:
+        lesson_ids = lessons[enrollment.course_id]
+        done = completed[enrollment.student_id, enrollment.course_id]
+        enrollment.completed_lessons = len(done)
+        enrollment.total_lessons = len(lesson_ids)
+        last = next_lesson = None
+        for lesson_id in lesson_ids:
+            if lesson_id not in done:
+                next_lesson = lesson_id
+                break
+            last = lesson_id
+        enrollment.last_completed_lesson_id = last
+        enrollment.next_lesson_id = next_lesson
+
+    Enrollment.objects.bulk_update(
+        enrollments,
+        ["completed_lessons", "total_lessons", "last_completed_lesson", "next_lesson"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0010_revocationevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='enrollment',
+            name='completed_lessons',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='last_completed_lesson',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='courses.lesson'),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='next_lesson',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='courses.lesson'),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='total_lessons',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-17 08:04
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def drop_duplicate_answers(apps, schema_editor):
+    # Keep the latest answer of each (student, question)
+    StudentAnswer = apps.get_model("courses", "StudentAnswer")
+    latest = (
+        StudentAnswer.objects.values("student", "question")
+        .annotate(keep=Max("id"))
+        .values_list("keep", flat=True)
+    )
+    StudentAnswer.objects.exclude(id__in=list(latest)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+        ('courses', '0011_enrollment_progress'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_answers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='studentanswer',
+            constraint=models.UniqueConstraint(fields=('student', 'question'), name='unique_student_answer'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-17 08:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0013_quiz_content_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionStats',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='courses.question')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('selected_a', models.PositiveIntegerField(default=0)),
+                ('selected_b', models.PositiveIntegerField(default=0)),
+                ('selected_c', models.PositiveIntegerField(default=0)),
+                ('selected_d', models.PositiveIntegerField(default=0)),
+                ('quiz', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='question_stats', to='courses.quiz')),
+            ],
+        ),
+    ]
@@ -4,9 +4,18 @@ import uuid
 
 
 class Course(models.Model):
+    CERTIFICATE_ENGINE_CHOICES = [
+        ("weasyprint", "WeasyPrint"),
+        ("reportlab", "ReportLab"),
+    ]
+
     title = models.CharField(max_length=200)
     description = models.TextField()
     teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE)
+    # Blank → settings.CERTIFICATE_RENDER_ENGINE
+    certificate_engine = models.CharField(
+        max_length=20, choices=CERTIFICATE_ENGINE_CHOICES, blank=True, default=""
+    )
 
     def __str__(self):
         return self.title
@@ -24,6 +33,13 @@ class Lesson(models.Model):
     class Meta:
         ordering = ["order"]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so saves can tell a move/reorder from an edit (see signals)
+        instance._loaded_placement = (instance.__dict__.get("course_id"), instance.__dict__.get("order"))
+        return instance
+
     def __str__(self):
         return self.title
 
@@ -31,6 +47,8 @@ class Lesson(models.Model):
 class Quiz(models.Model):
     # ❌ Remove OneToOneField to Course
     title = models.CharField(max_length=200)
+    # Bumped whenever a question changes; keys the cached answer key
+    content_version = models.PositiveIntegerField(default=1, editable=False)
 
     def __str__(self):
         return self.title
@@ -52,17 +70,49 @@ class Question(models.Model):
         return self.text
 
 
+class QuestionStats(models.Model):
+    """
+    Per-question counters, bumped by every quiz submission.
+    `attempts` counts submissions, blank answers included.
+    """
+    question = models.OneToOneField(Question, on_delete=models.CASCADE, primary_key=True, related_name="stats")
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name="question_stats")
+    attempts = models.PositiveIntegerField(default=0)
+    selected_a = models.PositiveIntegerField(default=0)
+    selected_b = models.PositiveIntegerField(default=0)
+    selected_c = models.PositiveIntegerField(default=0)
+    selected_d = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Stats for question {self.question_id}"
+
+
 class StudentAnswer(models.Model):
     student = models.ForeignKey("core.Student", on_delete=models.CASCADE)
     question = models.ForeignKey(Question, on_delete=models.CASCADE)
     selected = models.CharField(max_length=1)
     is_correct = models.BooleanField()
 
+    class Meta:
+        # One answer per question; resubmissions overwrite it
+        constraints = [
+            models.UniqueConstraint(fields=["student", "question"], name="unique_student_answer"),
+        ]
+
 
 class Enrollment(models.Model):
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
     joined_at = models.DateTimeField(auto_now_add=True)
+    # Progress counters, kept up to date by courses/progress.py
+    completed_lessons = models.PositiveIntegerField(default=0)
+    total_lessons = models.PositiveIntegerField(default=0)
+    last_completed_lesson = models.ForeignKey(
+        Lesson, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    next_lesson = models.ForeignKey(
+        Lesson, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
 
     class Meta:
         unique_together = ["student", "course"]
@@ -92,11 +142,62 @@ class Certificate(models.Model):
     issued_at = models.DateTimeField(blank=True, null=True)
     is_revoked = models.BooleanField(default=False)
       # 🔒 SECURITY FLAG
+    # PNG of the verification QR code, generated once at issuance
+    qr_png = models.BinaryField(blank=True, null=True, editable=False)
     class Meta:
         unique_together = ("student", "course")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so saves can tell a revoke/restore apart (see signals)
+        instance._loaded_is_revoked = instance.__dict__.get("is_revoked")
+        return instance
+
     def __str__(self):
         return f"{self.student.username} - {self.course.title}"
     
+class CertificateRenderJob(models.Model):
+    QUEUED = "queued"
+    RENDERING = "rendering"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RENDERING, "Rendering"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    certificate = models.ForeignKey(Certificate, on_delete=models.CASCADE, related_name="render_jobs")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.certificate_id} - {self.status}"
+
+
+class RevocationEvent(models.Model):
+    """
+    Append-only log of revocation changes. The id doubles as the version
+    of the revocation list; deleted certificates are logged as revoked.
+    """
+    id = models.BigAutoField(primary_key=True)
+    certificate_id = models.UUIDField()
+    revoked = models.BooleanField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.id}: {self.certificate_id} {'revoked' if self.revoked else 'restored'}"
+
+
 class Announcement(models.Model):
     title = models.CharField(max_length=200)
     message = models.TextField()
@@ -0,0 +1,138 @@
+import os
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+from .certificates import certificate_fingerprint, render_certificate_pdf
+
+
+class CertificatePdfStore:
+    """
+    On-disk store for rendered certificate PDFs.
+
+    Files are named <certificate uuid>-<template fingerprint>.pdf, so a
+    template, brand asset or render engine change simply stops matching
+    the old files.
+    The store is capped at `max_bytes`; the least recently served files
+    are evicted first (a hit refreshes the file's mtime).
+    """
+
+    def __init__(self, root, max_bytes):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None
+
+    def path_for(self, certificate):
+        return self.root / f"{certificate.id}-{certificate_fingerprint(certificate)}.pdf"
+
+    def get(self, certificate):
+        path = self.path_for(certificate)
+        try:
+            with open(path, "rb") as f:
+                pdf = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return pdf
+
+    def put(self, certificate, pdf):
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(certificate)
+
+        # Drop copies rendered from an older template before adding the new one
+        self.invalidate(certificate.id, keep=path.name)
+
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._size is not None:
+                self._size += len(pdf)
+        self._enforce_cap()
+        return path
+
+    def invalidate(self, certificate_id, keep=None):
+        if not self.root.exists():
+            return
+        for path in self.root.glob(f"{certificate_id}-*.pdf"):
+            if path.name == keep:
+                continue
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            with self._lock:
+                if self._size is not None:
+                    self._size -= size
+
+    def clear(self):
+        if not self.root.exists():
+            return
+        for path in self.root.glob("*.pdf"):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if not entry.name.endswith(".pdf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _enforce_cap(self):
+        with self._lock:
+            if self._size is not None and self._size <= self.max_bytes:
+                return
+
+            # Re-scan: the running total is only a per-process estimate,
+            # other workers write into the same directory.
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+
+            if total > self.max_bytes:
+                entries.sort()
+                # Evict down to 90% of the cap so we don't rescan on every put
+                target = self.max_bytes * 0.9
+                for _, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+
+            self._size = total
+
+
+pdf_store = CertificatePdfStore(
+    getattr(settings, "CERTIFICATE_CACHE_DIR", settings.BASE_DIR / "certificate_cache"),
+    getattr(settings, "CERTIFICATE_CACHE_MAX_BYTES", 512 * 1024 * 1024),
+)
+
+
+def get_certificate_pdf(certificate):
+    """
+    Cached PDF for a certificate, rendering and storing it on a miss.
+    """
+    pdf = pdf_store.get(certificate)
+    if pdf is None:
+        pdf = render_certificate_pdf(certificate)
+        pdf_store.put(certificate, pdf)
+    return pdf
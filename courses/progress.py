@@ -0,0 +1,148 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+
+from .models import Enrollment, Lesson, Progress
+
+
+# -----------------------------
+# ENROLLMENT PROGRESS COUNTERS
+# -----------------------------
+# Each Enrollment carries completed_lessons / total_lessons and two resume
+# pointers: next_lesson is the first lesson (by order) not yet completed,
+# last_completed_lesson the one just before it. complete_lesson() keeps
+# them current; other Progress writes rebuild the student's counters and
+# lesson edits rebuild the course (see signals), and
+# `manage.py rebuild_progress` repairs everything in bulk.
+
+def resume_pointers(lesson_ids, completed_ids):
+    """
+    (last completed lesson id, next lesson id) for lesson ids in order.
+    """
+    last = None
+    for lesson_id in lesson_ids:
+        if lesson_id not in completed_ids:
+            return last, lesson_id
+        last = lesson_id
+    return last, None
+
+
+def _ordered_lesson_ids(course_id):
+    return list(
+        Lesson.objects.filter(course_id=course_id).order_by("order", "id").values_list("id", flat=True)
+    )
+
+
+PROGRESS_FIELDS = ["completed_lessons", "total_lessons", "last_completed_lesson_id", "next_lesson_id"]
+
+
+def expected_progress(course_id, enrollments):
+    """
+    {enrollment id: (completed, total, last completed id, next id)} as
+    recomputed from Lesson and Progress, in two queries.
+    """
+    lesson_ids = _ordered_lesson_ids(course_id)
+    completed = defaultdict(set)
+    for student_id, lesson_id in Progress.objects.filter(
+        lesson__course_id=course_id,
+        student_id__in=[e.student_id for e in enrollments],
+        completed=True,
+    ).values_list("student_id", "lesson_id"):
+        completed[student_id].add(lesson_id)
+
+    expected = {}
+    for enrollment in enrollments:
+        done = completed[enrollment.student_id]
+        expected[enrollment.id] = (len(done), len(lesson_ids), *resume_pointers(lesson_ids, done))
+    return expected
+
+
+def rebuild_course_progress(course_id, student_ids=None):
+    """
+    Recompute the counters of a course's enrollments (optionally only some
+    students') in three queries plus one bulk update.
+    """
+    enrollments = list(Enrollment.objects.filter(course_id=course_id).only("id", "student_id"))
+    if student_ids is not None:
+        student_ids = set(student_ids)
+        enrollments = [e for e in enrollments if e.student_id in student_ids]
+    if not enrollments:
+        return 0
+
+    expected = expected_progress(course_id, enrollments)
+    for enrollment in enrollments:
+        for field, value in zip(PROGRESS_FIELDS, expected[enrollment.id]):
+            setattr(enrollment, field, value)
+
+    Enrollment.objects.bulk_update(
+        enrollments,
+        ["completed_lessons", "total_lessons", "last_completed_lesson", "next_lesson"],
+        batch_size=500,
+    )
+    return len(enrollments)
+
+
+def complete_lesson(student, lesson):
+    """
+    Mark a lesson completed and bump the student's enrollment counters in
+    the same transaction. Returns True if it wasn't completed before.
+    """
+    with transaction.atomic():
+        progress = Progress.objects.select_for_update().filter(student=student, lesson=lesson).first()
+        if progress is None:
+            progress = Progress(student=student, lesson=lesson)
+        elif progress.completed:
+            return False
+        progress.completed = True
+        # The counters are bumped below; tells the Progress signal to skip its rebuild
+        progress._counted = True
+        try:
+            with transaction.atomic():
+                progress.save()
+        except IntegrityError:
+            # Created concurrently by another request, which counted it
+            return False
+
+        enrollment = (
+            Enrollment.objects.select_for_update()
+            .filter(student=student, course_id=lesson.course_id)
+            .first()
+        )
+        if enrollment is None:
+            return True
+
+        enrollment.completed_lessons += 1
+        fields = ["completed_lessons"]
+
+        # Only finishing the lesson the student was on moves the pointers
+        if enrollment.next_lesson_id in (None, lesson.id):
+            done = set(
+                Progress.objects.filter(
+                    student=student, lesson__course_id=lesson.course_id, completed=True
+                ).values_list("lesson_id", flat=True)
+            )
+            enrollment.last_completed_lesson_id, enrollment.next_lesson_id = resume_pointers(
+                _ordered_lesson_ids(lesson.course_id), done
+            )
+            fields += ["last_completed_lesson", "next_lesson"]
+
+        enrollment.save(update_fields=fields)
+    return True
+
+
+def enrollment_counts(student, course):
+    """
+    (completed, total) for a student's course, from the enrollment when
+    there is one, else counted live.
+    """
+    counts = (
+        Enrollment.objects.filter(student=student, course=course)
+        .values_list("completed_lessons", "total_lessons")
+        .first()
+    )
+    if counts is not None:
+        return counts
+
+    total = course.lessons.count()
+    completed = Progress.objects.filter(student=student, lesson__course=course, completed=True).count()
+    return completed, total
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import threading
+from collections import namedtuple
+
+from .models import Question
+
+
+# -----------------------------
+# QUIZ PAYLOADS
+# -----------------------------
+# The student-independent part of quiz_detail (title and questions,
+# without answers) is encoded to JSON once per quiz version and cached in
+# this process. A request only splices the student's `locked` flag in
+# between the two pre-encoded halves.
+
+QuizPayload = namedtuple("QuizPayload", ["stamp", "head", "tail", "etag"])
+
+_payloads = {}  # quiz id → QuizPayload
+_lock = threading.Lock()
+
+
+def _stamp(quiz):
+    # content_version covers question edits, the title is on the row already
+    return quiz.content_version, quiz.title
+
+
+def quiz_payload(quiz):
+    cached = _payloads.get(quiz.id)
+    if cached is not None and cached.stamp == _stamp(quiz):
+        return cached
+
+    questions = [
+        {"id": id, "text": text, "a": a, "b": b, "c": c, "d": d}
+        for id, text, a, b, c, d in (
+            Question.objects.filter(quiz_id=quiz.id).order_by("id")
+            .values_list("id", "text", "option_a", "option_b", "option_c", "option_d")
+        )
+    ]
+    head = json.dumps({"id": quiz.id, "title": quiz.title})[:-1].encode() + b', "locked": '
+    tail = b', "questions": ' + json.dumps(questions).encode() + b"}"
+
+    digest = hashlib.sha256(head + tail).hexdigest()[:16]
+    payload = QuizPayload(stamp=_stamp(quiz), head=head, tail=tail, etag=digest)
+    with _lock:
+        _payloads[quiz.id] = payload
+    return payload
+
+
+def render(payload, locked):
+    """
+    (JSON bytes, ETag) of the payload for a student.
+    """
+    flag = b"true" if locked else b"false"
+    return payload.head + flag + payload.tail, f'"{payload.etag}-{int(locked)}"'
+
+
+def forget(quiz_id):
+    with _lock:
+        _payloads.pop(quiz_id, None)
@@ -0,0 +1,86 @@
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils.timezone import now
+
+from .models import CertificateRenderJob
+from .pdf_store import pdf_store
+from .certificates import render_certificate_pdf
+
+
+def stale_after():
+    return getattr(settings, "CERTIFICATE_RENDER_STALE_SECONDS", 600)
+
+
+def enqueue_render(certificate):
+    """
+    Queue a render for a certificate.
+    Reuses a job that is already waiting or running for the same certificate;
+    one stuck in `rendering` past the stale threshold is queued again first.
+    """
+    requeue_stale_jobs(stale_after(), certificate=certificate)
+    job = CertificateRenderJob.objects.filter(
+        certificate=certificate,
+        status__in=[CertificateRenderJob.QUEUED, CertificateRenderJob.RENDERING],
+    ).order_by("created_at").first()
+
+    if job is None:
+        job = CertificateRenderJob.objects.create(certificate=certificate)
+    return job
+
+
+def claim_next_job():
+    """
+    Atomically move the oldest queued job to `rendering`.
+    The status filter on the UPDATE makes two workers racing for the same
+    job safe without SELECT ... FOR UPDATE (not available on SQLite).
+    """
+    while True:
+        job_id = CertificateRenderJob.objects.filter(
+            status=CertificateRenderJob.QUEUED
+        ).order_by("created_at").values_list("id", flat=True).first()
+
+        if job_id is None:
+            return None
+
+        claimed = CertificateRenderJob.objects.filter(
+            id=job_id, status=CertificateRenderJob.QUEUED
+        ).update(status=CertificateRenderJob.RENDERING, started_at=now())
+
+        if claimed:
+            return CertificateRenderJob.objects.select_related(
+                "certificate__student", "certificate__course"
+            ).get(id=job_id)
+
+
+def run_job(job, render=render_certificate_pdf):
+    certificate = job.certificate
+    try:
+        if certificate.is_revoked:
+            raise ValueError("Certificate has been revoked.")
+        if pdf_store.get(certificate) is None:
+            pdf_store.put(certificate, render(certificate))
+    except Exception:
+        job.status = CertificateRenderJob.FAILED
+        job.error = traceback.format_exc(limit=5)
+    else:
+        job.status = CertificateRenderJob.DONE
+        job.error = ""
+
+    job.finished_at = now()
+    job.save(update_fields=["status", "error", "finished_at"])
+    return job
+
+
+def requeue_stale_jobs(older_than, certificate=None):
+    """
+    Put back jobs whose worker died mid-render (optionally one certificate's).
+    """
+    jobs = CertificateRenderJob.objects.filter(
+        status=CertificateRenderJob.RENDERING,
+        started_at__lt=now() - timedelta(seconds=older_than),
+    )
+    if certificate is not None:
+        jobs = jobs.filter(certificate=certificate)
+    return jobs.update(status=CertificateRenderJob.QUEUED, started_at=None)
@@ -0,0 +1,291 @@
+import base64
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.db import connections
+from django.template.loader import render_to_string
+
+from .assets import brand_assets
+
+
+CERTIFICATE_TEMPLATE = "courses/certificate_template.html"
+CERTIFICATE_STYLESHEET = "courses/certificate.css"
+
+
+# -----------------------------
+# ENGINES
+# -----------------------------
+
+class WeasyPrintEngine:
+    """
+    Renders certificate_template.html, the reference layout.
+
+    The stylesheet is parsed and the font configuration built once, and
+    the brand images are decoded into `image_cache` by a warm-up render,
+    so every later render only lays out the certificate text.
+    """
+
+    name = "weasyprint"
+    version = 1
+
+    def __init__(self):
+        from weasyprint import CSS
+        from weasyprint.text.fonts import FontConfiguration
+
+        self.font_config = FontConfiguration()
+        self.stylesheet = CSS(
+            string=render_to_string(CERTIFICATE_STYLESHEET),
+            font_config=self.font_config,
+        )
+        self.image_cache = {}
+
+    def render_html(self, html_string):
+        from weasyprint import HTML
+
+        return HTML(string=html_string).write_pdf(
+            stylesheets=[self.stylesheet],
+            font_config=self.font_config,
+            cache=self.image_cache,
+        )
+
+    def render(self, context):
+        return self.render_html(render_to_string(CERTIFICATE_TEMPLATE, context))
+
+    def warm_up(self, context):
+        self.render(context)
+        return self
+
+
+class ReportLabEngine:
+    """
+    Draws the certificate layout straight onto a ReportLab canvas.
+
+    Same page, shapes and text as certificate_template.html, without the
+    HTML/CSS layout pass. Sizes follow the template's CSS pixels
+    (1px = 0.75pt).
+    """
+
+    name = "reportlab"
+    # Bump when the drawing code changes, so stored PDFs are re-rendered
+    version = 1
+
+    TEAL = "#1B9AAA"
+    NAVY = "#142C52"
+    INK = "#071426"
+    GREY = "#777777"
+
+    def __init__(self):
+        from reportlab.lib.pagesizes import A4, landscape
+
+        self.width, self.height = landscape(A4)
+        self.assets_version = None
+        self.load_images()
+
+    def load_images(self):
+        from PIL import Image
+        from reportlab.lib.utils import ImageReader
+
+        self.logo = ImageReader(BytesIO(brand_assets.get("logo.png").data))
+
+        # The template shows people.png at 6% opacity; blend it into white
+        # once instead of relying on PDF transparency for every page.
+        people = Image.open(BytesIO(brand_assets.get("people.png").data)).convert("RGBA")
+        white = Image.new("RGBA", people.size, (255, 255, 255, 255))
+        faded = Image.blend(white, Image.alpha_composite(white, people), 0.06)
+        self.watermark = ImageReader(faded.convert("RGB"))
+        self.assets_version = brand_assets.version()
+
+    def px(self, value):
+        return value * 0.75
+
+    def y(self, top):
+        # CSS offset from the top of the page → ReportLab y from the bottom
+        return self.height - self.px(top)
+
+    def render(self, context):
+        from reportlab.lib.utils import ImageReader, simpleSplit
+        from reportlab.pdfgen import canvas
+
+        if brand_assets.version() != self.assets_version:
+            self.load_images()
+
+        buffer = BytesIO()
+        c = canvas.Canvas(buffer, pagesize=(self.width, self.height))
+        c.setTitle("Civora Nexus Certificate")
+        px = self.px
+        center = self.width / 2
+
+        # Border
+        c.setStrokeColor(self.TEAL)
+        c.setLineWidth(px(6))
+        c.rect(px(3), px(3), self.width - px(6), self.height - px(6))
+
+        # Watermark
+        size = px(420)
+        c.drawImage(self.watermark, (self.width - size) / 2, (self.height - size) / 2, size, size)
+
+        # Corner shapes
+        c.setFillColor(self.TEAL)
+        c.rect(0, self.height - px(100), px(200), px(100), stroke=0, fill=1)
+        c.rect(self.width - px(220), 0, px(220), px(120), stroke=0, fill=1)
+        c.setFillColor(self.NAVY)
+        for points in (
+            [(0, self.height), (px(100), self.height), (0, self.height - px(100))],
+            [(self.width, 0), (self.width - px(120), 0), (self.width, px(120))],
+        ):
+            path = c.beginPath()
+            path.moveTo(*points[0])
+            for point in points[1:]:
+                path.lineTo(*point)
+            path.close()
+            c.drawPath(path, stroke=0, fill=1)
+
+        # Logo
+        logo_w, logo_h = self.logo.getSize()
+        height = px(60)
+        width = height * logo_w / logo_h
+        c.drawImage(self.logo, center - width / 2, self.y(150), width, height, mask="auto")
+
+        # Titles
+        c.setFillColor(self.NAVY)
+        c.setFont("Helvetica-Bold", px(60))
+        c.drawCentredString(center, self.y(270), "CERTIFICATE")
+        c.setFillColor(self.TEAL)
+        c.setFont("Helvetica", px(16))
+        c.drawCentredString(center, self.y(305), "OF PARTICIPATION", charSpace=px(3))
+
+        # Content
+        c.setFillColor(self.INK)
+        c.drawCentredString(center, self.y(370), "THIS CERTIFICATE IS AWARDED TO")
+        c.setFillColor(self.TEAL)
+        c.setFont("Helvetica-Bold", px(32))
+        c.drawCentredString(center, self.y(420), context["student_name"])
+
+        body = (
+            f"Successfully completed the {context['course_name']} organized by "
+            "Civora Nexus. The session covered Git & GitHub concepts, "
+            "version control workflows, collaboration practices, and professional repository "
+            "management essential for internships and industry projects."
+        )
+        c.setFillColor(self.INK)
+        c.setFont("Helvetica", px(16))
+        line_y = self.y(465)
+        for line in simpleSplit(body, "Helvetica", px(16), self.width - px(2 * 200)):
+            c.drawCentredString(center, line_y, line)
+            line_y -= px(16 * 1.7)
+
+        # Footer: signature on the left, QR code on the right
+        sign_x = px(120)
+        c.setStrokeColor(self.NAVY)
+        c.setLineWidth(px(2))
+        c.line(sign_x, px(130), sign_x + px(200), px(130))
+        c.setFillColor(self.INK)
+        c.setFont("Helvetica-Bold", px(14))
+        c.drawCentredString(sign_x + px(100), px(112), "SHUBHAM DIGHE")
+        c.setFillColor(self.TEAL)
+        c.setFont("Helvetica", px(12))
+        c.drawCentredString(sign_x + px(100), px(96), "CEO & Founder")
+
+        qr = ImageReader(BytesIO(base64.b64decode(context["qr_base64"])))
+        qr_x = self.width - px(140 + 40 + 90)
+        c.drawImage(qr, qr_x, px(90), px(90), px(90))
+        c.setFillColor(self.NAVY)
+        c.setFont("Helvetica", px(10))
+        c.drawCentredString(qr_x + px(45), px(76), "Scan to verify")
+
+        # Date & note
+        c.setFillColor(self.INK)
+        c.setFont("Helvetica", px(12))
+        c.drawCentredString(center, px(44), f"Date: {context['date']}")
+        c.setFillColor(self.GREY)
+        c.setFont("Helvetica", px(11))
+        c.drawCentredString(center, px(20), "This is a system-generated certificate • civoranexus.com")
+
+        c.showPage()
+        c.save()
+        return buffer.getvalue()
+
+    def warm_up(self, context):
+        self.render(context)
+        return self
+
+
+ENGINES = {
+    WeasyPrintEngine.name: WeasyPrintEngine,
+    ReportLabEngine.name: ReportLabEngine,
+}
+
+_engines = {}
+
+
+def default_engine_name():
+    return getattr(settings, "CERTIFICATE_RENDER_ENGINE", WeasyPrintEngine.name)
+
+
+def get_engine(name=None):
+    """
+    Engine instance for the current process, created on first use.
+    """
+    name = name or default_engine_name()
+    if name not in _engines:
+        _engines[name] = ENGINES[name]()
+    return _engines[name]
+
+
+def render_pdf(context, engine=None):
+    return get_engine(engine).render(context)
+
+
+def _render_item(item):
+    engine, context = item
+    return render_pdf(context, engine)
+
+
+# -----------------------------
+# PROCESS POOL
+# -----------------------------
+
+def _init_worker(warm_up_context, engines):
+    for name in engines:
+        engine = get_engine(name)
+        if warm_up_context is not None:
+            engine.warm_up(warm_up_context)
+
+
+class RendererPool:
+    """
+    Pool of worker processes, each holding warm render engines.
+    Takes (engine name, template context) pairs and returns PDF bytes.
+    """
+
+    def __init__(self, processes=None, warm_up_context=None, engines=None):
+        # Forked workers must not share the parent's DB connections
+        connections.close_all()
+        self.processes = (
+            processes
+            or getattr(settings, "CERTIFICATE_RENDER_PROCESSES", None)
+            or os.cpu_count()
+            or 1
+        )
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=_init_worker,
+            initargs=(warm_up_context, engines or [default_engine_name()]),
+        )
+
+    def submit(self, engine, context):
+        return self.executor.submit(render_pdf, context, engine)
+
+    def map(self, items, chunksize=1):
+        return self.executor.map(_render_item, items, chunksize=chunksize)
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -0,0 +1,157 @@
+import hashlib
+import math
+import struct
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db.models import Max
+
+from .models import RevocationEvent
+
+
+# -----------------------------
+# REVOCATION LIST
+# -----------------------------
+# Built from the RevocationEvent log, whose latest id is the list version.
+# Each process keeps one snapshot and rebuilds it when the version moved,
+# checking at most every CERTIFICATE_REVOCATION_REFRESH_SECONDS.
+#
+# Binary snapshot, big-endian:
+#
+#   b"CRL1" | version (u64) | count (u32) | bloom bits m (u32) | hashes k (u8)
+#   | count sorted 16-byte UUIDs | ceil(m / 8) bloom filter bytes
+#
+# Bloom bit i of the filter is byte i // 8, bit i % 8 (LSB first). A UUID
+# sets bits (h1 + j * h2) % m for j in range(k), where h1 and h2 are the
+# first two big-endian u64s of sha256(uuid bytes).
+
+MAGIC = b"CRL1"
+_HEADER = struct.Struct(">4sQIIB")
+
+RevocationSnapshot = namedtuple(
+    "RevocationSnapshot", ["version", "revoked", "bloom_bits", "bloom_hashes", "body", "etag"]
+)
+
+
+def _bloom_positions(value, bits, hashes):
+    digest = hashlib.sha256(value).digest()
+    h1, h2 = struct.unpack_from(">QQ", digest)
+    return [(h1 + j * h2) % bits for j in range(hashes)]
+
+
+def bloom_filter(values, false_positive_rate):
+    n = max(1, len(values))
+    bits = max(64, math.ceil(-n * math.log(false_positive_rate) / math.log(2) ** 2))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, round(bits / n * math.log(2)))
+
+    array = bytearray(bits // 8)
+    for value in values:
+        for position in _bloom_positions(value, bits, hashes):
+            array[position // 8] |= 1 << (position % 8)
+    return bits, hashes, bytes(array)
+
+
+def bloom_contains(bloom, bits, hashes, value):
+    return all(
+        bloom[position // 8] & (1 << (position % 8))
+        for position in _bloom_positions(value, bits, hashes)
+    )
+
+
+def current_version():
+    return RevocationEvent.objects.aggregate(version=Max("id"))["version"] or 0
+
+
+def build_snapshot():
+    state = {}
+    version = 0
+    for event_id, certificate_id, revoked in (
+        RevocationEvent.objects.order_by("id").values_list("id", "certificate_id", "revoked").iterator()
+    ):
+        state[certificate_id] = revoked
+        version = event_id
+
+    revoked = frozenset(certificate_id for certificate_id, flag in state.items() if flag)
+    packed = sorted(certificate_id.bytes for certificate_id in revoked)
+    bits, hashes, bloom = bloom_filter(
+        packed, getattr(settings, "CERTIFICATE_REVOCATION_BLOOM_FP_RATE", 0.001)
+    )
+    body = _HEADER.pack(MAGIC, version, len(packed), bits, hashes) + b"".join(packed) + bloom
+
+    return RevocationSnapshot(
+        version=version,
+        revoked=revoked,
+        bloom_bits=bits,
+        bloom_hashes=hashes,
+        body=body,
+        etag=f'"crl-{version}"',
+    )
+
+
+class RevocationList:
+    """
+    The current snapshot for this process. `get()` costs one
+    `MAX(id)` query per refresh interval, and a rebuild only when the
+    log has grown.
+    """
+
+    def __init__(self, refresh_interval=60):
+        self.refresh_interval = refresh_interval
+        self._snapshot = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.refresh_interval:
+            return self._snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != current_version():
+                self._snapshot = build_snapshot()
+            self._checked_at = now
+        return self._snapshot
+
+    def invalidate(self):
+        # Changes made in this process show up on the next get()
+        self._checked_at = None
+
+
+revocation_list = RevocationList(
+    getattr(settings, "CERTIFICATE_REVOCATION_REFRESH_SECONDS", 60)
+)
+
+
+def is_revoked(certificate_id):
+    return certificate_id in revocation_list.get().revoked
+
+
+def revocation_delta(since):
+    """
+    Changes after version `since`, collapsed to each certificate's latest
+    state: {"version", "revoked": [ids], "restored": [ids]}.
+    `version` is always the log's current version, even when `since` is
+    ahead of it.
+    """
+    # Read first, so events logged meanwhile are left for the next delta
+    version = current_version()
+    state = {}
+    for certificate_id, revoked in (
+        RevocationEvent.objects.filter(id__gt=since, id__lte=version).order_by("id")
+        .values_list("certificate_id", "revoked").iterator()
+    ):
+        state[certificate_id] = revoked
+
+    return {
+        "version": version,
+        "revoked": sorted(str(certificate_id) for certificate_id, flag in state.items() if flag),
+        "restored": sorted(str(certificate_id) for certificate_id, flag in state.items() if not flag),
+    }
+
+
+def record(certificate_id, revoked):
+    RevocationEvent.objects.create(certificate_id=certificate_id, revoked=revoked)
+    revocation_list.invalidate()
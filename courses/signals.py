@@ -0,0 +1,113 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Certificate, Enrollment, Lesson, Progress, Question, Quiz
+from .pdf_store import pdf_store
+from . import grading, quiz_payloads, revocation, verification
+from .progress import rebuild_course_progress
+
+
+# -----------------------------
+# CERTIFICATE PDF CACHE
+# -----------------------------
+
+@receiver(post_save, sender=Certificate)
+def drop_revoked_certificate_pdf(sender, instance, **kwargs):
+    if instance.is_revoked:
+        pdf_store.invalidate(instance.id)
+
+
+@receiver(post_delete, sender=Certificate)
+def drop_deleted_certificate_pdf(sender, instance, **kwargs):
+    pdf_store.invalidate(instance.id)
+
+
+# -----------------------------
+# VERIFICATION CACHE
+# -----------------------------
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+def drop_cached_verification(sender, instance, **kwargs):
+    verification.invalidate(instance.id)
+
+
+
+# -----------------------------
+# REVOCATION LIST
+# -----------------------------
+
+@receiver(post_save, sender=Certificate)
+def log_revocation_change(sender, instance, created, **kwargs):
+    previous = False if created else getattr(instance, "_loaded_is_revoked", None)
+    if instance.is_revoked != previous:
+        if previous is not None or instance.is_revoked:
+            revocation.record(instance.id, instance.is_revoked)
+    instance._loaded_is_revoked = instance.is_revoked
+
+
+@receiver(post_delete, sender=Certificate)
+def log_deleted_certificate(sender, instance, **kwargs):
+    # Signed QR tokens outlive the row, so a deletion revokes them
+    revocation.record(instance.id, True)
+
+
+# -----------------------------
+# ENROLLMENT PROGRESS
+# -----------------------------
+
+@receiver(post_save, sender=Enrollment)
+def init_enrollment_progress(sender, instance, created, **kwargs):
+    if created:
+        rebuild_course_progress(instance.course_id, [instance.student_id])
+
+
+@receiver(post_save, sender=Lesson)
+def rebuild_progress_on_lesson_change(sender, instance, created, **kwargs):
+    # Adding, moving or reordering lessons shifts totals and resume pointers;
+    # title and content edits don't
+    previous = None if created else getattr(instance, "_loaded_placement", None)
+    placement = (instance.course_id, instance.order)
+    if previous != placement:
+        rebuild_course_progress(instance.course_id)
+        if previous is not None and previous[0] not in (None, instance.course_id):
+            rebuild_course_progress(previous[0])
+    instance._loaded_placement = placement
+
+
+@receiver(post_delete, sender=Lesson)
+def rebuild_progress_on_lesson_delete(sender, instance, **kwargs):
+    rebuild_course_progress(instance.course_id)
+
+
+@receiver(post_save, sender=Progress)
+def rebuild_progress_on_progress_save(sender, instance, **kwargs):
+    # complete_lesson() bumps the counters itself; admin edits and other
+    # direct writes rebuild the one student's enrollment
+    if not getattr(instance, "_counted", False):
+        rebuild_course_progress(instance.lesson.course_id, [instance.student_id])
+
+
+@receiver(post_delete, sender=Progress)
+def rebuild_progress_on_progress_delete(sender, instance, origin=None, **kwargs):
+    # Cascades from a lesson, student or course delete are covered there
+    if isinstance(origin, Progress) or getattr(origin, "model", None) is Progress:
+        rebuild_course_progress(instance.lesson.course_id, [instance.student_id])
+
+
+# -----------------------------
+# QUIZ ANSWER KEYS
+# -----------------------------
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def bump_quiz_content_version(sender, instance, **kwargs):
+    Quiz.objects.filter(id=instance.quiz_id).update(content_version=F("content_version") + 1)
+
+
+@receiver(post_delete, sender=Quiz)
+def drop_cached_quiz(sender, instance, **kwargs):
+    # Some databases reuse ids; never serve a deleted quiz's key or payload
+    grading.forget(instance.id)
+    quiz_payloads.forget(instance.id)
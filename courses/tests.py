@@ -1,3 +1,351 @@
-from django.test import TestCase
+import struct
+import uuid
+from datetime import date
+from html.parser import HTMLParser
+from io import BytesIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.template.loader import render_to_string
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models import Student, Teacher
+from .certificate_tokens import CertificateClaims, InvalidToken, sign, unsign
+from .certificates import has_completed_course, sample_context
+from .models import Course, Enrollment, Lesson, Progress, Quiz, RevocationEvent
+from .progress import complete_lesson
+from .renderer import CERTIFICATE_TEMPLATE, ReportLabEngine, WeasyPrintEngine
+from .revocation import bloom_contains, build_snapshot, revocation_delta
+
+
+class LessonUnlockTests(TestCase):
+    def setUp(self):
+        teacher = Teacher.objects.create(user=User.objects.create_user("teacher"), subject="Git")
+        self.course = Course.objects.create(title="Git", description="", teacher=teacher)
+
+        user = User.objects.create_user("student")
+        self.student = Student.objects.create(user=user, roll_number="S1", department="CS")
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def add_lessons(self, count):
+        start = self.course.lessons.count() + 1
+        for order in range(start, start + count):
+            Lesson.objects.create(
+                course=self.course,
+                title=f"Lesson {order}",
+                content="",
+                order=order,
+                quiz=Quiz.objects.create(title=f"Quiz {order}"),
+            )
+
+    def complete(self, lesson, quiz=True):
+        Progress.objects.create(student=self.student, lesson=lesson, completed=True)
+        if quiz:
+            self.student.completed_quizzes.add(lesson.quiz)
+
+    def unlocked(self):
+        response = self.client.get(f"/api/courses/{self.course.id}/lessons/")
+        return [lesson["unlocked"] for lesson in response.json()["courses"]]
+
+    def test_unlock_follows_lessons_and_quizzes(self):
+        self.add_lessons(4)
+        first, second, third, _ = self.course.lessons.all()
+        self.complete(first)
+        self.complete(second, quiz=False)
+
+        self.assertEqual(self.unlocked(), [True, True, False, False])
+
+        self.student.completed_quizzes.add(second.quiz)
+        self.assertEqual(self.unlocked(), [True, True, True, False])
+
+        locked = self.client.get(f"/api/student/lesson/{self.course.lessons.last().id}/")
+        self.assertEqual(locked.status_code, 403)
+        opened = self.client.get(f"/api/student/lesson/{third.id}/")
+        self.assertEqual(opened.status_code, 200)
+
+    def test_query_count_does_not_grow_with_lessons(self):
+        self.add_lessons(3)
+        self.complete(self.course.lessons.first())
+        with CaptureQueriesContext(connection) as small:
+            self.unlocked()
+
+        self.add_lessons(37)
+        for lesson in self.course.lessons.all()[1:20]:
+            self.complete(lesson)
+        with CaptureQueriesContext(connection) as large:
+            self.unlocked()
+
+        self.assertEqual(len(small), len(large))
+
+
+
+class EnrollmentProgressTests(TestCase):
+    def setUp(self):
+        teacher = Teacher.objects.create(user=User.objects.create_user("teacher"), subject="Git")
+        self.course = Course.objects.create(title="Git", description="", teacher=teacher)
+        self.other = Course.objects.create(title="GitHub", description="", teacher=teacher)
+        self.lessons = [
+            Lesson.objects.create(course=self.course, title=f"Lesson {order}", content="", order=order)
+            for order in (1, 2, 3)
+        ]
+
+        user = User.objects.create_user("student")
+        self.student = Student.objects.create(user=user, roll_number="S1", department="CS")
+        Enrollment.objects.create(student=self.student, course=self.course)
+        Enrollment.objects.create(student=self.student, course=self.other)
+
+    def counters(self, course=None):
+        enrollment = Enrollment.objects.get(student=self.student, course=course or self.course)
+        return (
+            enrollment.completed_lessons,
+            enrollment.total_lessons,
+            enrollment.last_completed_lesson_id,
+            enrollment.next_lesson_id,
+        )
+
+    def test_complete_lesson_moves_counters_and_pointers(self):
+        first, second, third = self.lessons
+        self.assertEqual(self.counters(), (0, 3, None, first.id))
+
+        self.assertTrue(complete_lesson(self.student, first))
+        self.assertFalse(complete_lesson(self.student, first))
+        self.assertEqual(self.counters(), (1, 3, first.id, second.id))
+
+        # Skipping ahead counts, but the student still resumes at lesson 2
+        complete_lesson(self.student, third)
+        self.assertEqual(self.counters(), (2, 3, first.id, second.id))
+        self.assertFalse(has_completed_course(self.student, self.course))
+
+        complete_lesson(self.student, second)
+        self.assertEqual(self.counters(), (3, 3, third.id, None))
+        self.assertTrue(has_completed_course(self.student, self.course))
+
+    def test_direct_progress_writes_rebuild_counters(self):
+        # e.g. ProgressAdmin: not through complete_lesson()
+        for lesson in self.lessons:
+            Progress.objects.create(student=self.student, lesson=lesson, completed=True)
+        self.assertEqual(self.counters(), (3, 3, self.lessons[2].id, None))
+        self.assertTrue(has_completed_course(self.student, self.course))
+
+        Progress.objects.get(lesson=self.lessons[1]).delete()
+        self.assertEqual(self.counters(), (2, 3, self.lessons[0].id, self.lessons[1].id))
+
+        progress = Progress.objects.get(lesson=self.lessons[0])
+        progress.completed = False
+        progress.save()
+        self.assertEqual(self.counters(), (1, 3, None, self.lessons[0].id))
+
+    def test_adding_and_deleting_lessons_rebuilds_counters(self):
+        for lesson in self.lessons:
+            complete_lesson(self.student, lesson)
+        self.assertTrue(has_completed_course(self.student, self.course))
+
+        extra = Lesson.objects.create(course=self.course, title="Lesson 4", content="", order=4)
+        self.assertEqual(self.counters(), (3, 4, self.lessons[2].id, extra.id))
+        self.assertFalse(has_completed_course(self.student, self.course))
+
+        extra.delete()
+        self.assertEqual(self.counters(), (3, 3, self.lessons[2].id, None))
+
+        self.lessons[0].delete()
+        self.assertEqual(self.counters(), (2, 2, self.lessons[2].id, None))
+
+    def test_moving_a_lesson_rebuilds_both_courses(self):
+        complete_lesson(self.student, self.lessons[0])
+        lesson = self.lessons[0]
+        lesson.course = self.other
+        lesson.save()
+
+        self.assertEqual(self.counters(), (0, 2, None, self.lessons[1].id))
+        self.assertEqual(self.counters(self.other), (1, 1, lesson.id, None))
+
+    def test_editing_a_lesson_does_not_rebuild(self):
+        lesson = Lesson.objects.get(id=self.lessons[1].id)
+        lesson.title = "Renamed"
+        with CaptureQueriesContext(connection) as queries:
+            lesson.save()
+        self.assertEqual(len(queries), 1)
+
+        lesson.order = 0
+        lesson.save()
+        self.assertEqual(self.counters(), (0, 3, None, lesson.id))
+
+
+class _TemplateText(HTMLParser):
+    # Text of every block (div / p) of the certificate body, inline tags merged
+    def __init__(self):
+        super().__init__()
+        self.in_body = False
+        self.current = []
+        self.blocks = []
+
+    def flush(self):
+        text = " ".join("".join(self.current).split())
+        if text:
+            self.blocks.append(text)
+        self.current = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.in_body = True
+        elif tag in ("div", "p"):
+            self.flush()
+
+    def handle_endtag(self, tag):
+        if tag in ("div", "p", "body"):
+            self.flush()
+
+    def handle_data(self, data):
+        if self.in_body:
+            self.current.append(data)
+
+
+def _squash(text):
+    # Engines space and wrap differently; compare the characters only
+    return "".join(text.split())
+
+
+class CertificateEngineParityTests(SimpleTestCase):
+    def setUp(self):
+        self.context = {
+            **sample_context(),
+            "student_name": "Ada Lovelace",
+            "course_name": "Analytical Engines 101",
+            "date": "17 October 2026",
+        }
+        parser = _TemplateText()
+        parser.feed(render_to_string(CERTIFICATE_TEMPLATE, self.context))
+        self.blocks = parser.blocks
+
+    def pdf_text(self, pdf):
+        try:
+            import pymupdf
+        except ImportError:
+            pymupdf = None
+        if pymupdf is not None:
+            with pymupdf.open(stream=pdf, filetype="pdf") as document:
+                return " ".join(page.get_text() for page in document)
+
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            self.skipTest("PyMuPDF or pypdf is needed to read PDF text")
+        return " ".join(page.extract_text() for page in PdfReader(BytesIO(pdf)).pages)
+
+    def assertMatchesTemplate(self, engine):
+        text = _squash(self.pdf_text(engine.render(self.context)))
+        for block in self.blocks:
+            self.assertIn(_squash(block), text, f"{engine.name} is missing {block!r}")
+
+    def test_template_text_covers_certificate_fields(self):
+        text = " ".join(self.blocks)
+        for expected in (
+            "Ada Lovelace",
+            "Successfully completed the Analytical Engines 101 organized by Civora Nexus.",
+            "Date: 17 October 2026",
+            "SHUBHAM DIGHE",
+            "CEO & Founder",
+            "Scan to verify",
+        ):
+            self.assertIn(expected, text)
+
+    def test_reportlab_matches_template(self):
+        self.assertMatchesTemplate(ReportLabEngine())
+
+    def test_weasyprint_matches_template(self):
+        try:
+            engine = WeasyPrintEngine()
+        except OSError:
+            self.skipTest("WeasyPrint's native libraries are not installed")
+        self.assertMatchesTemplate(engine)
+
+
+@override_settings(CERTIFICATE_SIGNING_KEYS={"k1": "old-key", "k2": "new-key"}, CERTIFICATE_SIGNING_KEY_ID="k2")
+class CertificateTokenTests(SimpleTestCase):
+    def setUp(self):
+        self.claims = CertificateClaims(
+            certificate_id=uuid.uuid4(),
+            course_id=7,
+            issued_on=date(2026, 10, 17),
+            student_name="Zoë Åberg",
+        )
+
+    def test_round_trip(self):
+        token = sign(self.claims)
+        self.assertTrue(token.startswith("k2."))
+        self.assertEqual(unsign(token), self.claims)
+
+    def test_tampered_payload_or_signature_is_rejected(self):
+        key_id, payload, signature = sign(self.claims).split(".")
+        forged = sign(self.claims._replace(student_name="Forged Person")).split(".")[1]
+        flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+
+        for token in (f"{key_id}.{forged}.{signature}", f"{key_id}.{payload}.{flipped}", "k2.garbage", ""):
+            with self.assertRaises(InvalidToken):
+                unsign(token)
+
+    def test_unknown_key_id_is_rejected(self):
+        with override_settings(CERTIFICATE_SIGNING_KEYS={"k9": "new-key"}, CERTIFICATE_SIGNING_KEY_ID="k9"):
+            token = sign(self.claims)
+        with self.assertRaises(InvalidToken):
+            unsign(token)
+
+    def test_old_key_id_verifies_after_rotation(self):
+        old = sign(self.claims, key_id="k1")
+        self.assertEqual(unsign(old), self.claims)
+
+        # Same payload under the other key id must not verify
+        with self.assertRaises(InvalidToken):
+            unsign("k2." + old.split(".", 1)[1])
+
+        with override_settings(CERTIFICATE_SIGNING_KEYS={"k2": "new-key"}):
+            with self.assertRaises(InvalidToken):
+                unsign(old)
+
+    def test_blank_key_is_rejected(self):
+        token = sign(self.claims, key_id="k1")
+        with override_settings(CERTIFICATE_SIGNING_KEYS={"k1": "", "k2": ""}):
+            with self.assertRaises(ImproperlyConfigured):
+                sign(self.claims)
+            with self.assertRaises(InvalidToken):
+                unsign(token)
+
+
+class RevocationListTests(TestCase):
+    def setUp(self):
+        self.ids = [uuid.uuid4() for _ in range(50)]
+        for certificate_id in self.ids:
+            RevocationEvent.objects.create(certificate_id=certificate_id, revoked=True)
+        # The last one is restored again
+        self.restored = self.ids.pop()
+        self.version = RevocationEvent.objects.create(certificate_id=self.restored, revoked=False).id
+
+    def test_snapshot_follows_documented_layout(self):
+        body = build_snapshot().body
+        magic, version, count, bits, hashes = struct.unpack_from(">4sQIIB", body)
+        self.assertEqual((magic, version, count), (b"CRL1", self.version, len(self.ids)))
+
+        offset = struct.calcsize(">4sQIIB")
+        revoked = [body[offset + 16 * i:offset + 16 * (i + 1)] for i in range(count)]
+        bloom = body[offset + 16 * count:]
+        self.assertEqual(revoked, sorted(certificate_id.bytes for certificate_id in self.ids))
+        self.assertEqual(len(bloom), (bits + 7) // 8)
+
+        for certificate_id in self.ids:
+            self.assertTrue(bloom_contains(bloom, bits, hashes, certificate_id.bytes))
+
+    def test_delta_reports_current_version(self):
+        full = revocation_delta(0)
+        self.assertEqual(full["version"], self.version)
+        self.assertEqual(full["revoked"], sorted(str(certificate_id) for certificate_id in self.ids))
+        self.assertEqual(full["restored"], [str(self.restored)])
+
+        behind = revocation_delta(self.version - 1)
+        self.assertEqual(behind, {"version": self.version, "revoked": [], "restored": [str(self.restored)]})
+
+        for since in (self.version, self.version + 1000):
+            self.assertEqual(revocation_delta(since), {"version": self.version, "revoked": [], "restored": []})
@@ -12,6 +12,7 @@ urlpatterns = [
 
     path("student/dashboard/", views.student_dashboard),
     path("student/continue/", views.resume_learning),
+    path("student/course/<int:course_id>/resume/", views.resume_course),
 
     path("student/lesson/<int:lesson_id>/", views.lesson_detail),
     path("student/lesson/<int:lesson_id>/can-access/", views.can_access_lesson),
@@ -20,9 +21,17 @@ urlpatterns = [
     path("courses/<int:course_id>/progress/", views.course_progress),
     path("student/quiz/<int:quiz_id>/submit/", views.submit_quiz),
     path("quiz/<int:quiz_id>/", views.quiz_detail),
+    path("quiz/<int:quiz_id>/analytics/", views.quiz_analytics),
 
     path("certificate/<int:course_id>/", views.certificate),
+    path("certificate/jobs/<uuid:job_id>/", views.certificate_job),
+    path("courses/<int:course_id>/certificates/export/", views.course_certificates_export),
+    path("admission/metrics/", views.admission_metrics),
     path("verify-certificate/<uuid:id>/", views.verify_certificate),
+    path("verify-certificate/<uuid:id>/json/", views.verify_certificate_json),
+    path("verify/<str:token>/", views.verify_certificate_token),
+    path("verify-certificates/", views.verify_certificates_batch),
+    path("certificate-revocations/", views.certificate_revocations),
 
     # 🔔 Notifications (JWT)
     path("notifications/", views.notifications_api),
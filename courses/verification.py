@@ -0,0 +1,182 @@
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.timezone import localtime
+
+from .certificate_tokens import InvalidToken, unsign
+from .models import Certificate, Course
+from .revocation import is_revoked, revocation_list
+
+
+# -----------------------------
+# VERIFICATION CACHE
+# -----------------------------
+# Resolved verification records, keyed by certificate UUID, in the
+# "verification" cache (bounded LRU with a TTL, see settings.CACHES).
+# Saves and deletes drop the entry through signals, but only in the process
+# that made them, so a cached record is also checked against the shared
+# revocation list: a (un)revocation anywhere is honoured within
+# CERTIFICATE_REVOCATION_REFRESH_SECONDS instead of the cache TTL.
+
+def _cache():
+    return caches["verification"]
+
+
+def _key(certificate_id):
+    return f"certificate:{certificate_id}"
+
+
+# Only the columns a verification record shows; rows come back as dicts
+PROJECTION = (
+    "id", "is_revoked", "issued_at",
+    "student__username", "student__first_name", "student__last_name",
+    "course__title",
+)
+
+
+def _projection():
+    return Certificate.objects.values(*PROJECTION)
+
+
+def verification_record(row):
+    """
+    Record for a `PROJECTION` row (None for an unknown id).
+    """
+    if row is None:
+        return {"status": "invalid"}
+
+    if row["is_revoked"]:
+        return {"status": "revoked", "certificate_id": str(row["id"])}
+
+    full_name = f"{row['student__first_name']} {row['student__last_name']}".strip()
+    return {
+        "status": "valid",
+        "student": full_name or row["student__username"],
+        "course": row["course__title"],
+        "issued_at": localtime(row["issued_at"]).strftime("%d %B %Y") if row["issued_at"] else "—",
+        "certificate_id": str(row["id"]),
+    }
+
+
+def _is_current(record, certificate_id):
+    if record["status"] == "invalid":
+        return True
+    return (record["status"] == "revoked") == is_revoked(certificate_id)
+
+
+def verify(certificate_id):
+    """
+    Verification record for a certificate id, from the cache when possible.
+    Unknown ids are cached too, for a shorter time.
+    """
+    record = _cache().get(_key(certificate_id))
+    if record is not None and _is_current(record, certificate_id):
+        return record
+
+    row = _projection().filter(id=certificate_id).first()
+    record = verification_record(row)
+
+    timeout = None  # cache default
+    if row is None:
+        timeout = _negative_ttl()
+    _cache().set(_key(certificate_id), record, timeout)
+    return record
+
+
+def record_etag(record):
+    """
+    ETag of a verification record, tied to the revocation list version so
+    every revocation busts cached copies downstream.
+    """
+    digest = hashlib.sha256(json.dumps(record, sort_keys=True).encode()).hexdigest()[:16]
+    return f'"{revocation_list.get().version}-{digest}"'
+
+
+def _negative_ttl():
+    return getattr(settings, "CERTIFICATE_VERIFY_NEGATIVE_TTL", 30)
+
+
+def verify_many(certificate_ids, chunk_size=500):
+    """
+    Yield (id, record) for every id, in input order.
+
+    Each chunk costs one cache get_many plus, for the misses, a single
+    `id__in` query. Ids that aren't UUIDs come back as invalid.
+    """
+    for start in range(0, len(certificate_ids), chunk_size):
+        chunk = certificate_ids[start:start + chunk_size]
+
+        parsed = {}
+        for raw in chunk:
+            try:
+                parsed[raw] = uuid.UUID(str(raw))
+            except ValueError:
+                pass
+
+        keys = {_key(value): value for value in parsed.values()}
+        records = {
+            str(keys[key]): record
+            for key, record in _cache().get_many(list(keys)).items()
+            if _is_current(record, keys[key])
+        }
+
+        missing = [value for value in set(parsed.values()) if str(value) not in records]
+        if missing:
+            found = {row["id"]: row for row in _projection().filter(id__in=missing)}
+            fresh, unknown = {}, {}
+            for value in missing:
+                record = verification_record(found.get(value))
+                records[str(value)] = record
+                (fresh if value in found else unknown)[_key(value)] = record
+            _cache().set_many(fresh)
+            _cache().set_many(unknown, _negative_ttl())
+
+        for raw in chunk:
+            value = parsed.get(raw)
+            yield str(raw), records[str(value)] if value else {"status": "invalid"}
+
+
+def invalidate(certificate_id):
+    _cache().delete(_key(certificate_id))
+
+
+# -----------------------------
+# SIGNED TOKENS
+# -----------------------------
+# QR codes carry a signed token (see courses/certificate_tokens.py), so a
+# scan is answered from the token itself plus the in-memory revocation
+# list (courses/revocation.py); the certificate table is never read.
+
+def course_title(course_id):
+    key = f"course-title:{course_id}"
+    title = _cache().get(key)
+    if title is None:
+        title = Course.objects.filter(id=course_id).values_list("title", flat=True).first() or "—"
+        _cache().set(key, title)
+    return title
+
+
+def verify_token(token):
+    """
+    Verification record for a signed token. Bad signatures and unknown key
+    ids are invalid; the only lookups are the revocation list and the
+    course title cache.
+    """
+    try:
+        claims = unsign(token)
+    except InvalidToken:
+        return {"status": "invalid"}
+
+    if is_revoked(claims.certificate_id):
+        return {"status": "revoked", "certificate_id": str(claims.certificate_id)}
+
+    return {
+        "status": "valid",
+        "student": claims.student_name,
+        "course": course_title(claims.course_id),
+        "issued_at": claims.issued_on.strftime("%d %B %Y"),
+        "certificate_id": str(claims.certificate_id),
+    }
@@ -17,10 +17,17 @@ from django.http import JsonResponse
 
 
 from .models import (
-    Course, Lesson, Enrollment, Progress,
+    Course, Lesson, Enrollment,
     Quiz, Question, StudentAnswer, Announcement
 )
 from .serializers import CourseSerializer, LessonSerializer
+from .unlocking import is_lesson_unlocked, lesson_unlock_states
+from . import quiz_payloads
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from .progress import complete_lesson, enrollment_counts
+from django.db import transaction
+from .grading import PASS_SCORE, answer_key, grade, quiz_score
+from .analytics import question_statistics, record_submission
 
 
 # -----------------------------
@@ -38,11 +45,10 @@ def course_list(request):
 @permission_classes([IsAuthenticated, IsStudent])
 def course_lessons(request, course_id):
     student = request.user.student
-    lessons = Lesson.objects.filter(course_id=course_id).order_by("order")
 
+    # 🔓 Unlock state of every lesson in one pass, see courses/unlocking.py
     data = []
-    for l in lessons:
-        unlocked = is_lesson_unlocked(student, l)
+    for l, unlocked in lesson_unlock_states(student, course_id):
         data.append({
             "id": l.id,
             "title": l.title,
@@ -64,42 +70,6 @@ def enroll(request):
     return Response({"message": "Enrolled"})
 
 
-# -----------------------------
-# LESSON LOCKING LOGIC
-# -----------------------------
-
-def is_lesson_unlocked(student, lesson):
-    """
-    Check if a lesson is unlocked for the student.
-    First lesson is always unlocked.
-    Subsequent lessons require all previous lessons and their quizzes to be completed/passed.
-    """
-    # First lesson always unlocked
-    if lesson.order == 1:
-        return True
-
-    # All previous lessons
-    previous = Lesson.objects.filter(course=lesson.course, order__lt=lesson.order).order_by("order")
-
-    for prev in previous:
-        # Check if lesson is completed
-        lesson_done = Progress.objects.filter(student=student, lesson=prev, completed=True).exists()
-
-        # Check if quiz is passed (if quiz exists)
-        quiz_done = True  # default True if no quiz
-        if hasattr(prev, "quiz") and prev.quiz:
-            quiz_done = Quiz.objects.filter(
-                id=prev.quiz.id,
-                id__in=student.completed_quizzes.values_list("id", flat=True)
-            ).exists()
-
-        # If either lesson or quiz not done → locked
-        if not (lesson_done and quiz_done):
-            return False
-
-    return True
-
-
 @api_view(["GET"])
 @permission_classes([IsAuthenticated, IsStudent])
 def lesson_detail(request, lesson_id):
@@ -118,25 +88,37 @@ from django.contrib.auth.decorators import login_required
 def quiz_detail(request, quiz_id):
     quiz = get_object_or_404(Quiz, id=quiz_id)
     student = request.user.student
-    lesson = get_object_or_404(Lesson, quiz=quiz)
 
     passed = student.completed_quizzes.filter(id=quiz.id).exists()
 
+    # 📦 Shared pre-encoded payload + this student's flag, see courses/quiz_payloads.py
+    body, etag = quiz_payloads.render(quiz_payloads.quiz_payload(quiz), locked=passed)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def quiz_analytics(request, quiz_id):
+    quiz = get_object_or_404(Quiz, id=quiz_id)
+
+    # 👩‍🏫 Only admins and the teacher of the quiz's course
+    if not (
+        request.user.is_staff
+        or Lesson.objects.filter(quiz=quiz, course__teacher__user=request.user).exists()
+    ):
+        return Response({"detail": "Not allowed"}, status=403)
+
     return Response({
-        "id": quiz.id,
+        "quiz_id": quiz.id,
         "title": quiz.title,
-        "locked": passed,
-        "questions": [
-            {
-                "id": q.id,
-                "text": q.text,
-                "a": q.option_a,
-                "b": q.option_b,
-                "c": q.option_c,
-                "d": q.option_d,
-            }
-            for q in quiz.questions.all()
-        ]
+        "questions": question_statistics(quiz.id),
     })
 
 
@@ -146,24 +128,11 @@ def can_access_lesson(request, lesson_id):
     student = request.user.student
     lesson = get_object_or_404(Lesson, id=lesson_id)
 
-    if not Enrollment.objects.filter(student=student, course=lesson.course).exists():
+    if not Enrollment.objects.filter(student=student, course_id=lesson.course_id).exists():
         return Response({"access": False})
 
-    if lesson.order == 1:
-        return Response({"access": True})
-
-    prev = Lesson.objects.filter(
-        course=lesson.course,
-        order=lesson.order - 1
-    ).first()
-
-    done = Progress.objects.filter(
-        student=student,
-        lesson=prev,
-        completed=True
-    ).exists()
-
-    return Response({"access": done})
+    # Same rule as course_lessons and lesson_detail
+    return Response({"access": is_lesson_unlocked(student, lesson)})
 
 
 # -----------------------------
@@ -185,29 +154,42 @@ def student_dashboard(request):
             status=status.HTTP_403_FORBIDDEN
         )
 
-    enrollments = Enrollment.objects.filter(student=student)
+    # 📈 One query: counters live on the enrollment, see courses/progress.py
+    enrollments = list(
+        Enrollment.objects.filter(student=student)
+        .select_related("course")
+        .only("course_id", "course__title", "completed_lessons", "total_lessons", "next_lesson_id")
+        .order_by("id")
+    )
+
+    # ▶ ?include=resume → next lesson of every course, one more query
+    resume = None
+    if "resume" in request.GET.get("include", "").split(","):
+        resume = Lesson.objects.only("id", "title", "order").in_bulk(
+            [e.next_lesson_id for e in enrollments if e.next_lesson_id]
+        )
 
     data = []
 
     for e in enrollments:
-        lessons = Lesson.objects.filter(course=e.course)
-        total = lessons.count()
-
-        completed = Progress.objects.filter(
-            student=student,
-            lesson__course=e.course,
-            completed=True
-        ).count()
+        total = e.total_lessons
+        completed = e.completed_lessons
 
         percent = int((completed / total) * 100) if total else 0
 
-        data.append({
-            "course_id": e.course.id,
+        item = {
+            "course_id": e.course_id,
             "course": e.course.title,
             "total": total,
             "completed": completed,
             "progress": percent
-        })
+        }
+        if resume is not None:
+            lesson = resume.get(e.next_lesson_id)
+            item["next_lesson"] = (
+                {"id": lesson.id, "title": lesson.title, "order": lesson.order} if lesson else None
+            )
+        data.append(item)
 
     return Response(data)
 
@@ -218,12 +200,7 @@ def course_progress(request, course_id):
     student = request.user.student
     course = get_object_or_404(Course, id=course_id)
 
-    total = Lesson.objects.filter(course=course).count()
-    completed = Progress.objects.filter(
-        student=student,
-        lesson__course=course,
-        completed=True
-    ).count()
+    completed, total = enrollment_counts(student, course)
 
     percent = int((completed / total) * 100) if total else 0
 
@@ -239,33 +216,18 @@ def course_progress(request, course_id):
 @permission_classes([IsAuthenticated, IsStudent])
 def resume_learning(request):
     student = request.user.student
-    enrollments = Enrollment.objects.filter(student=student)
+    # ▶ Resume pointers live on the enrollment, see courses/progress.py
+    enrollments = Enrollment.objects.filter(student=student).select_related(
+        "course", "last_completed_lesson", "next_lesson"
+    )
 
     response = []
 
     for e in enrollments:
-        lessons = Lesson.objects.filter(course=e.course).order_by("order")
-
-        completed = Progress.objects.filter(
-            student=student,
-            lesson__course=e.course,
-            completed=True
-        ).values_list("lesson_id", flat=True)
-
-        last_done = None
-        next_lesson = None
-
-        for l in lessons:
-            if l.id in completed:
-                last_done = l
-            else:
-                next_lesson = l
-                break
-
         response.append({
             "course": e.course.title,
-            "last_completed": last_done.title if last_done else None,
-            "continue_lesson": next_lesson.title if next_lesson else None
+            "last_completed": e.last_completed_lesson.title if e.last_completed_lesson else None,
+            "continue_lesson": e.next_lesson.title if e.next_lesson else None
         })
 
     return Response(response)
@@ -275,47 +237,34 @@ def resume_learning(request):
 @permission_classes([IsAuthenticated, IsStudent])
 def resume_course(request, course_id):
     student = request.user.student
-    course = get_object_or_404(Course, id=course_id)
-
     enrollment = Enrollment.objects.filter(
-        student=student, course=course
-    ).first()
+        student=student, course_id=course_id
+    ).select_related("last_completed_lesson", "next_lesson").first()
 
     if not enrollment:
+        get_object_or_404(Course, id=course_id)
         return Response(
             {"error": "Not enrolled in this course"},
             status=403
         )
 
-    lessons = Lesson.objects.filter(course=course).order_by("order")
-
-    if not lessons.exists():
+    if not (enrollment.next_lesson or enrollment.last_completed_lesson):
         return Response(
             {"error": "No lessons found for this course"},
             status=404
         )
 
-    for lesson in lessons:
-        progress = Progress.objects.filter(
-            student=student,
-            lesson=lesson,
-            completed=True
-        ).first()
-
-        if not progress:
-            return Response({
-                "lesson_id": lesson.id,
-                "title": lesson.title,
-                "order": lesson.order,
-                "status": "resume"
-            })
+    if enrollment.next_lesson:
+        lesson, state = enrollment.next_lesson, "resume"
+    else:
+        # Every lesson done → the last one
+        lesson, state = enrollment.last_completed_lesson, "completed"
 
-    last = lessons.last()
     return Response({
-        "lesson_id": last.id,
-        "title": last.title,
-        "order": last.order,
-        "status": "completed"
+        "lesson_id": lesson.id,
+        "title": lesson.title,
+        "order": lesson.order,
+        "status": state
     })
 
 
@@ -330,70 +279,62 @@ def submit_quiz(request, quiz_id):
     quiz = get_object_or_404(Quiz, id=quiz_id)
     answers = request.data.get("answers", {})
 
-    total = quiz.questions.count()
     if not answers:
         return Response({"error": "No answers submitted"}, status=400)
 
-    correct = 0
-    result = []
-
-    # Evaluate answers
-    import re
-
-    for q in quiz.questions.all():
-        selected = str(answers.get(str(q.id), "")).strip().lower()
-        correct_option = re.sub(r'[^a-z]', '', q.correct.strip().lower())
-        is_correct = selected == correct_option
-
-        if is_correct:
-           correct += 1
-
-        result.append({
-           "question_id": q.id,
-           "selected": selected,
-           "correct": correct_option,
-           "is_correct": is_correct
-        })
-
-        # Save StudentAnswer
-        StudentAnswer.objects.update_or_create(
+    # Answer key from the per-process cache, see courses/grading.py
+    key = answer_key(quiz)
+    total = len(key)
+    correct, result = grade(key, answers)
+    rows = [
+        StudentAnswer(
             student=student,
-            question=q,
-            defaults={"selected": selected, "is_correct": is_correct}
+            question_id=item["question_id"],
+            selected=item["selected"],
+            is_correct=item["is_correct"],
         )
+        for item in result
+    ]
 
-    score = int((correct / total) * 100)
-    passed = score >= 60
+    score = quiz_score(correct, total)
+    passed = score >= PASS_SCORE
 
     next_lesson_id = None
     all_lessons_completed = False
 
-    if passed:
-        # Mark current lesson as completed
-        lesson = get_object_or_404(Lesson, quiz=quiz)
-        Progress.objects.update_or_create(
-            student=student,
-            lesson=lesson,
-            defaults={"completed": True}
+    with transaction.atomic():
+        # Save StudentAnswers: one upsert on (student, question)
+        StudentAnswer.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["student", "question"],
+            update_fields=["selected", "is_correct"],
         )
+        record_submission(quiz.id, {row.question_id: row.selected for row in rows})
 
-        # Try to find next lesson by order
-        next_lesson = Lesson.objects.filter(
-            course=lesson.course,
-            order__gt=lesson.order
-        ).order_by("order").first()
+        if passed:
+            # Mark current lesson and quiz as completed
+            lesson = get_object_or_404(Lesson, quiz=quiz)
+            complete_lesson(student, lesson)
+            student.completed_quizzes.add(quiz)
 
-        # Fallback: if order is duplicate, pick by id
-        if not next_lesson:
+            # Try to find next lesson by order
             next_lesson = Lesson.objects.filter(
-                course=lesson.course,
-                id__gt=lesson.id
-            ).order_by("id").first()
-
-        if next_lesson:
-            next_lesson_id = next_lesson.id
-        else:
-            all_lessons_completed 
+                course_id=lesson.course_id,
+                order__gt=lesson.order
+            ).order_by("order").first()
+
+            # Fallback: if order is duplicate, pick by id
+            if not next_lesson:
+                next_lesson = Lesson.objects.filter(
+                    course_id=lesson.course_id,
+                    id__gt=lesson.id
+                ).order_by("id").first()
+
+            if next_lesson:
+                next_lesson_id = next_lesson.id
+            else:
+                all_lessons_completed = True
     return Response({
         "score": score,
         "passed": passed,
@@ -408,38 +349,23 @@ def submit_quiz(request, quiz_id):
 @login_required
 def student_dashboard_page(request):
     student = request.user.student
-    enrollments = Enrollment.objects.filter(student=student)
+    enrollments = Enrollment.objects.filter(student=student).select_related("course", "next_lesson")
 
     dashboard = []
 
     for e in enrollments:
-        lessons = Lesson.objects.filter(course=e.course).order_by("order")
-
-        completed_ids = Progress.objects.filter(
-            student=student,
-            lesson__course=e.course,
-            completed=True
-        ).values_list("lesson_id", flat=True)
-
-        total = lessons.count()
-        completed = len(completed_ids)
+        total = e.total_lessons
+        completed = e.completed_lessons
         percent = int((completed / total) * 100) if total else 0
-        print("PROGRESS:", percent)
-
-        resume = None
-        for l in lessons:
-            if l.id not in completed_ids:
-                resume = l
-                break
 
         dashboard.append({
             "course": e.course,
-            "lessons": lessons,
-            "completed_ids": completed_ids,
+            "course_id": e.course_id,
             "completed": completed,
             "total": total,
+            "total_lessons": total,
             "progress": percent,
-            "resume": resume
+            "resume": e.next_lesson
         })
 
     return render(request, "courses/student_dashboard.html", {
@@ -451,55 +377,92 @@ from django.http import HttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from .models import Course, Progress
+from .models import Course
 from core.permissions import IsStudent  # if you have this
-from django.template.loader import render_to_string
-from weasyprint import HTML
-from django.utils.timezone import now
 import os
 from django.conf import settings
-import os
-import base64
-import qrcode
-from io import BytesIO
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from django.template.loader import render_to_string
-from django.utils.timezone import now
 from django.urls import reverse
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
-from weasyprint import HTML
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 
-from .models import Course, Progress, Certificate
-from django.conf import settings
+from .models import Course, Certificate, CertificateRenderJob
+from .pdf_store import pdf_store
+from .render_queue import enqueue_render
+from .certificates import (
+    certificate_etag, has_completed_course, issue_certificate,
+)
+from .exports import course_certificates_zip_response
+from .admission import admission_control, all_metrics
+from django.db.models import Count
+
+
+def set_certificate_cache_headers(response, certificate_obj):
+    # No Last-Modified: the issue date doesn't move when the template,
+    # brand assets or engine change, the ETag does
+    response["ETag"] = certificate_etag(certificate_obj)
+    # Private: the same URL returns each student's own certificate
+    patch_cache_control(
+        response,
+        private=True,
+        max_age=getattr(settings, "CERTIFICATE_BROWSER_CACHE_SECONDS", 86400),
+    )
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+def certificate_pdf_response(certificate_obj, pdf):
+    response = HttpResponse(pdf, content_type="application/pdf")
+    response["Content-Disposition"] = f'attachment; filename="{certificate_obj.course.title}_certificate.pdf"'
+    return set_certificate_cache_headers(response, certificate_obj)
+
+
+def certificate_not_modified(request, certificate_obj):
+    """
+    304 response if the client's copy of the PDF is still current, else None.
+    """
+    response = get_conditional_response(request, etag=certificate_etag(certificate_obj))
+    if response is None:
+        return None
+    return set_certificate_cache_headers(response, certificate_obj)
+
+
+def certificate_job_response(request, job, status=202):
+    return Response({
+        "job_id": str(job.id),
+        "status": job.status,
+        "poll_url": request.build_absolute_uri(f"/api/certificate/jobs/{job.id}/"),
+    }, status=status)
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@admission_control("certificate")
 def certificate(request, course_id):
     user = request.user                  # ✅ User
+
+    # 🔁 Client already has this PDF → 304 without the progress check or a render
+    if "HTTP_IF_NONE_MATCH" in request.META:
+        issued = Certificate.objects.select_related("course").filter(
+            student=user,
+            course_id=course_id,
+            issued_at__isnull=False,
+            is_revoked=False,
+        ).first()
+        if issued:
+            not_modified = certificate_not_modified(request, issued)
+            if not_modified:
+                return not_modified
+
     student = request.user.student       # ✅ Student profile
 
     course = get_object_or_404(Course, id=course_id)
 
-    total = course.lessons.count()
-    done = Progress.objects.filter(
-        student=student,                 # Student model
-        lesson__course=course,
-        completed=True
-    ).count()
-
-    if done != total:
+    if not has_completed_course(student, course):
         return HttpResponse("You have not completed this course.", status=403)
 
-    certificate_obj, created = Certificate.objects.get_or_create(
-        student=user,                    # ✅ User model (matches Certificate)
-        course=course,
-    )
-    if not certificate_obj.issued_at:
-        certificate_obj.issued_at = now()
-        certificate_obj.save()
+    certificate_obj, created = issue_certificate(user, course)
 
     if created:
        Notification.objects.create(
@@ -513,51 +476,83 @@ def certificate(request, course_id):
     if certificate_obj.is_revoked:
         return HttpResponse("This certificate has been revoked.", status=403)
 
-    RENDER_BASE_URL = "https://certificate-verification-backend-7gpb.onrender.com"
+    # 📄 Already rendered → serve straight from the PDF store
+    pdf = pdf_store.get(certificate_obj)
+    if pdf is not None:
+        return certificate_pdf_response(certificate_obj, pdf)
 
-    verify_url = f"https://certificate-verification-backend-7gpb.onrender.com/verify-certificate/{certificate_obj.id}/" 
-    print("VERIFY URL:", verify_url)
-    
+    # ⏳ Otherwise hand it to the certificate_worker queue
+    job = enqueue_render(certificate_obj)
+    return certificate_job_response(request, job)
 
-    qr = qrcode.make(verify_url)
-    buffer = BytesIO()
-    qr.save(buffer, format="PNG")
-    qr_base64 = base64.b64encode(buffer.getvalue()).decode()
 
-    def file_path(path):
-        return "file:///" + path.replace("\\", "/")
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@admission_control("certificate_export")
+def course_certificates_export(request, course_id):
+    course = get_object_or_404(Course.objects.select_related("teacher"), id=course_id)
 
-    logo_path = file_path(os.path.join(settings.BASE_DIR, "static", "brand", "logo.png"))
-    people_icon = file_path(os.path.join(settings.BASE_DIR, "static", "brand", "people.png"))
+    # 👩‍🏫 Only admins and the course's own teacher
+    if not (request.user.is_staff or course.teacher.user_id == request.user.id):
+        return Response({"detail": "Not allowed"}, status=403)
 
-    html_string = render_to_string(
-        "courses/certificate_template.html",
-        {
-            "student_name": user.get_full_name() or user.username,
-            "course_name": course.title,
-            "date": now().strftime("%d %B %Y"),
-            "logo_path": logo_path,
-            "people_icon": people_icon,
-            "qr_base64": qr_base64,
-        }
+    return course_certificates_zip_response(course)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def admission_metrics(request):
+    # 📊 Counters of this worker process only; the render queue is shared
+    queue = dict(
+        CertificateRenderJob.objects.filter(
+            status__in=[CertificateRenderJob.QUEUED, CertificateRenderJob.RENDERING]
+        ).order_by().values_list("status").annotate(count=Count("id"))
     )
+    return Response({
+        "pid": os.getpid(),
+        "endpoints": all_metrics(),
+        "render_queue": {
+            "queued": queue.get(CertificateRenderJob.QUEUED, 0),
+            "rendering": queue.get(CertificateRenderJob.RENDERING, 0),
+        },
+    })
 
-    html = HTML(string=html_string)
-    pdf = html.write_pdf()
 
-    response = HttpResponse(pdf, content_type="application/pdf")
-    response["Content-Disposition"] = f'attachment; filename="{course.title}_certificate.pdf"'
-    return response
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def certificate_job(request, job_id):
+    job = get_object_or_404(
+        CertificateRenderJob.objects.select_related("certificate__course"),
+        id=job_id,
+        certificate__student=request.user,
+    )
+    certificate_obj = job.certificate
+
+    if certificate_obj.is_revoked:
+        return HttpResponse("This certificate has been revoked.", status=403)
+
+    if job.status == CertificateRenderJob.DONE:
+        pdf = pdf_store.get(certificate_obj)
+        if pdf is not None:
+            return certificate_pdf_response(certificate_obj, pdf)
+        # Evicted from the store since → render again
+        return certificate_job_response(request, enqueue_render(certificate_obj))
+
+    if job.status == CertificateRenderJob.FAILED:
+        return Response({
+            "job_id": str(job.id),
+            "status": job.status,
+            "detail": "Rendering failed, request the certificate again to retry.",
+        })
+
+    return certificate_job_response(request, job, status=200)
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def mark_lesson_completed(request, lesson_id):
     student = request.user.student
     lesson = Lesson.objects.get(id=lesson_id)
 
-    progress, created = Progress.objects.get_or_create(student=student, lesson=lesson)
-    if not progress.completed:
-       progress.completed = True
-       progress.save()
+    complete_lesson(student, lesson)
 
     Notification.objects.create(
         user=request.user,
@@ -573,28 +568,89 @@ from django.shortcuts import get_object_or_404, render
 
 from django.shortcuts import render, get_object_or_404
 from .models import Certificate
+from django.views.decorators.http import require_GET
+from . import verification
 def verify_certificate(request, id):
+    # 🔍 Cached lookup, see courses/verification.py
+    return render(request, "courses/verify_certificate.html", verification.verify(id))
+
+
+@require_GET
+def verify_certificate_json(request, id):
+    """
+    Public JSON verification, cacheable by browsers and reverse proxies.
+    """
+    record = verification.verify(id)
+    if record["status"] == "invalid":
+        response = JsonResponse(record, status=404)
+        max_age = getattr(settings, "CERTIFICATE_VERIFY_NEGATIVE_TTL", 30)
+    else:
+        etag = verification.record_etag(record)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = JsonResponse(record, json_dumps_params={"ensure_ascii": False})
+        response["ETag"] = etag
+        max_age = getattr(settings, "CERTIFICATE_VERIFY_MAX_AGE", 300)
+
+    # Same answer for everyone: no cookies or auth involved
+    patch_cache_control(response, public=True, max_age=max_age)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
+def verify_certificate_token(request, token):
+    # 🔏 Signed QR token: no certificate lookup, only the revocation list
+    return render(request, "courses/verify_certificate.html", verification.verify_token(token))
+
+
+import json
+from django.http import StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+
+# Public, like verify_certificate: no login, no CSRF (no cookies involved)
+@csrf_exempt
+@require_POST
+def verify_certificates_batch(request):
+    """
+    POST {"ids": [...]} → status of every certificate in one call.
+    Send `Accept: application/x-ndjson` (or ?format=ndjson) to get one JSON
+    line per id, streamed as they are resolved, with a higher id limit.
+    """
+    stream = (
+        request.GET.get("format") == "ndjson"
+        or "application/x-ndjson" in request.headers.get("Accept", "")
+    )
+
     try:
-        certificate = Certificate.objects.get(id=id)
-    except Certificate.DoesNotExist:
-        return render(request, "courses/verify_certificate.html", {
-            "status": "invalid"
-        })
+        body = json.loads(request.body or b"null")
+    except ValueError:
+        return JsonResponse({"error": "Body must be JSON"}, status=400)
+
+    ids = body.get("ids") if isinstance(body, dict) else body
+    if not isinstance(ids, list) or not ids:
+        return JsonResponse({"error": "Send a non-empty list of certificate ids as 'ids'"}, status=400)
+    if not all(isinstance(certificate_id, str) for certificate_id in ids):
+        return JsonResponse({"error": "Certificate ids must be strings"}, status=400)
+
+    limit = getattr(
+        settings,
+        "CERTIFICATE_BATCH_VERIFY_STREAM_LIMIT" if stream else "CERTIFICATE_BATCH_VERIFY_LIMIT",
+        100000 if stream else 5000,
+    )
+    if len(ids) > limit:
+        return JsonResponse({"error": f"At most {limit} ids per request"}, status=400)
 
-    if certificate.is_revoked:
-        return render(request, "courses/verify_certificate.html", {
-            "status": "revoked",
-            "certificate_id": certificate.id
-        })
-    
+    if stream:
+        lines = (
+            json.dumps({"id": certificate_id, **record}) + "\n"
+            for certificate_id, record in verification.verify_many(ids)
+        )
+        return StreamingHttpResponse(lines, content_type="application/x-ndjson")
 
-    return render(request, "courses/verify_certificate.html", {
-        "status": "valid",
-        "student": certificate.student.get_full_name() or certificate.student.username,
-        "course": certificate.course.title,
-        "issued_at": certificate.issued_at.strftime("%d %B %Y") if certificate.issued_at else "—",
-        "certificate_id": certificate.id,
-    })
+    results = dict(verification.verify_many(ids))
+    return JsonResponse({"count": len(results), "results": results})
 from django.contrib.auth.decorators import login_required
 
 
@@ -665,4 +721,39 @@ def unread_notification_count_api(request):
         user=request.user,
         is_read=False
     ).count()
-    return Response({"count": count})
\ No newline at end of file
+    return Response({"count": count})
+
+from . import revocation
+
+
+@require_GET
+def certificate_revocations(request):
+    """
+    Public revocation list. Without parameters: the binary snapshot
+    (sorted revoked UUIDs + Bloom filter, format in courses/revocation.py).
+    With ?since=<version>: a JSON delta of the changes after that version.
+    """
+    since = request.GET.get("since")
+    if since is not None:
+        try:
+            since = int(since)
+        except ValueError:
+            return JsonResponse({"error": "since must be an integer version"}, status=400)
+        delta = revocation.revocation_delta(since)
+        response = JsonResponse(delta)
+        version = delta["version"]
+    else:
+        snapshot = revocation.revocation_list.get()
+        response = get_conditional_response(request, etag=snapshot.etag)
+        if response is None:
+            response = HttpResponse(snapshot.body, content_type="application/octet-stream")
+        response["ETag"] = snapshot.etag
+        version = snapshot.version
+
+    response["X-Revocation-Version"] = str(version)
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=getattr(settings, "CERTIFICATE_REVOCATION_REFRESH_SECONDS", 60),
+    )
+    return response
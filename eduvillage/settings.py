@@ -159,4 +159,59 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 LOGIN_URL = "/admin/login/"
 LOGIN_REDIRECT_URL = "/dashboard/"
-LOGOUT_REDIRECT_URL = "/login/"
\ No newline at end of file
+LOGOUT_REDIRECT_URL = "/login/"
+# Certificates
+CERTIFICATE_VERIFY_BASE_URL = "https://certificate-verification-backend-7gpb.onrender.com"
+# Rendered certificate PDFs (kept outside MEDIA_ROOT, downloads go through the view)
+CERTIFICATE_CACHE_DIR = BASE_DIR / "certificate_cache"
+CERTIFICATE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# "weasyprint" (template fidelity) or "reportlab" (fast canvas drawing); courses can override
+CERTIFICATE_RENDER_ENGINE = "weasyprint"
+# How long browsers may reuse a downloaded certificate before revalidating
+CERTIFICATE_BROWSER_CACHE_SECONDS = 24 * 60 * 60
+# How often the in-memory brand images are checked for edits on disk
+CERTIFICATE_ASSET_CHECK_SECONDS = 5
+# Worker processes used for bulk renders (defaults to the CPU count)
+CERTIFICATE_RENDER_PROCESSES = None
+# Render jobs stuck in "rendering" this long are assumed dead and queued again
+CERTIFICATE_RENDER_STALE_SECONDS = 600
+# Admission control for expensive endpoints, per worker process (see courses/admission.py):
+# concurrent requests, per-user tokens per second, per-user burst
+ADMISSION_LIMITS = {
+    "certificate": {"concurrency": 4, "rate": 0.5, "burst": 5},
+    "certificate_export": {"concurrency": 1, "rate": 1 / 60, "burst": 2},
+}
+
+# Caches
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Public certificate verification lookups (LRU, bounded)
+    "verification": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "certificate-verification",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 50000},
+    },
+}
+# Unknown certificate ids are remembered for a shorter time
+CERTIFICATE_VERIFY_NEGATIVE_TTL = 30
+# Public max-age of the JSON verification endpoint
+CERTIFICATE_VERIFY_MAX_AGE = 300
+# Max ids per batch verification request (JSON / streamed NDJSON)
+CERTIFICATE_BATCH_VERIFY_LIMIT = 5000
+CERTIFICATE_BATCH_VERIFY_STREAM_LIMIT = 100000
+# QR verify tokens are HMAC-signed with CERTIFICATE_SIGNING_KEYS[CERTIFICATE_SIGNING_KEY_ID].
+# The key must come from the CERTIFICATE_SIGNING_KEY environment variable (a long random
+# secret, never SECRET_KEY, which is public here). Without it no token is issued or accepted:
+# QR codes fall back to the unsigned /verify-certificate/<id>/ link (check courses.W001).
+# To rotate, add a new id and switch to it; keep the old one while its QR codes are in use.
+CERTIFICATE_SIGNING_KEYS = {
+    "k1": os.environ.get("CERTIFICATE_SIGNING_KEY", ""),
+}
+CERTIFICATE_SIGNING_KEY_ID = "k1"
+# How often each process checks the revocation list for changes (also its public max-age)
+CERTIFICATE_REVOCATION_REFRESH_SECONDS = 60
+# Bloom filter false-positive rate of the published revocation snapshot
+CERTIFICATE_REVOCATION_BLOOM_FP_RATE = 0.001